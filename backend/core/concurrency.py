@@ -0,0 +1,106 @@
+"""
+Adaptive concurrency control for LLM-bound pipeline steps.
+
+Implications (step 4) and validation (step 6) share one provider rate
+limit, so they should share one limiter instead of each guessing its own
+fixed concurrency. AdaptiveSemaphore applies AIMD (additive increase,
+multiplicative decrease): sustained successes grow the window by one,
+a 429 halves it. This keeps the provider saturated without tripping
+rate limits.
+"""
+
+import asyncio
+
+from loguru import logger
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Successes required before the window grows by one
+SUCCESSES_PER_INCREASE = 8
+
+
+# =============================================================================
+# ADAPTIVE SEMAPHORE
+# =============================================================================
+
+
+class AdaptiveSemaphore:
+    """
+    Async semaphore whose limit adapts to provider feedback (AIMD).
+
+    Usage:
+        sem = AdaptiveSemaphore(10)
+        async with sem:
+            await llm.complete(...)
+        sem.record_success()
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int | None = None):
+        self._limit = max(initial, min_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit or max(initial * 2, initial)
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency window."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while self._in_flight >= self._limit:
+                await self._condition.wait()
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additive increase: grow the window after sustained successes."""
+        self._successes += 1
+        if self._successes >= SUCCESSES_PER_INCREASE and self._limit < self._max_limit:
+            self._successes = 0
+            self._limit += 1
+            logger.debug(f"Concurrency window increased to {self._limit}")
+
+    def record_rate_limited(self) -> None:
+        """Multiplicative decrease: halve the window on 429."""
+        self._successes = 0
+        new_limit = max(self._min_limit, self._limit // 2)
+        if new_limit < self._limit:
+            self._limit = new_limit
+            logger.warning(f"Rate limited, concurrency window halved to {self._limit}")
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
+# =============================================================================
+# GLOBAL RATE-LIMIT FEEDBACK
+# =============================================================================
+
+# The HTTP layer (core.models.LLMClient) sees 429s but has no reference to
+# the step-level semaphore, so the active controller registers itself here.
+_active_controller: AdaptiveSemaphore | None = None
+
+
+def register_controller(controller: AdaptiveSemaphore | None) -> None:
+    """Register the semaphore that should receive rate-limit feedback."""
+    global _active_controller
+    _active_controller = controller
+
+
+def notify_rate_limited() -> None:
+    """Forward a 429 signal to the active controller (if any)."""
+    if _active_controller is not None:
+        _active_controller.record_rate_limited()
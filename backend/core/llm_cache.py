@@ -0,0 +1,182 @@
+"""
+Persistent content-addressable cache for LLM call results.
+
+Both LLM steps (implications, validation) are network-bound; repeated runs
+over unchanged inputs should never re-issue a call. This module memoizes
+results on disk, keyed by the full call identity:
+
+    (provider, model, prompt_version, canonical JSON of the input)
+
+Each component is length-prefixed (8 bytes, big-endian) before hashing so
+that key boundaries are unambiguous, then hashed with SHA-256. Blobs are
+stored under LIVE_DIR/llm_cache/<sha[:2]>/<sha>.json with a UTC timestamp
+and model metadata for later inspection or eviction.
+
+Usage:
+    result = await get_or_call(
+        ("openrouter", model, PROMPT_VERSION, group),
+        lambda: call_llm(...),
+    )
+"""
+
+import hashlib
+import json
+import os
+from contextlib import suppress
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from core.paths import LIVE_DIR, live_path
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CACHE_DIR = LIVE_DIR / "llm_cache"
+
+# String form for per-call entry path construction (avoids a PosixPath
+# allocation on every cache probe)
+CACHE_DIR_STR = live_path("llm_cache")
+
+# Bump when the on-disk entry layout changes (invalidates old entries)
+CACHE_FORMAT_VERSION = 1
+
+
+# =============================================================================
+# KEY DERIVATION
+# =============================================================================
+
+
+def cache_key(parts: tuple) -> str:
+    """
+    Derive a content-addressed key from the call identity tuple.
+
+    Each part is serialized to canonical JSON (sorted keys) and
+    length-prefixed with 8 big-endian bytes so adjacent parts can never
+    collide by concatenation.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray)):
+            data = bytes(part)
+        elif isinstance(part, str):
+            data = part.encode("utf-8")
+        else:
+            data = json.dumps(part, sort_keys=True, default=str).encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return f"{CACHE_DIR_STR}/{key[:2]}/{key}.json"
+
+
+# =============================================================================
+# CACHE OPERATIONS
+# =============================================================================
+
+
+def get_cached(key: str, validate: Callable[[Any], bool] | None = None) -> Any | None:
+    """
+    Load a cached result, or None on miss.
+
+    Args:
+        key: Key from cache_key()
+        validate: Optional predicate over the stored result; entries that
+                  fail validation are evicted as stale.
+
+    Returns:
+        The cached result payload, or None
+    """
+    path = _entry_path(key)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Evicting unreadable cache entry {key[:12]}: {e}")
+        _evict(path)
+        return None
+
+    if entry.get("format_version") != CACHE_FORMAT_VERSION:
+        _evict(path)
+        return None
+
+    result = entry.get("result")
+    if validate is not None and not validate(result):
+        logger.debug(f"Evicting stale cache entry {key[:12]} (failed validation)")
+        _evict(path)
+        return None
+
+    return result
+
+
+def _evict(path: str) -> None:
+    with suppress(OSError):
+        os.remove(path)
+
+
+def put_cached(key: str, result: Any, model: str = "") -> None:
+    """Persist a result under the given key (best-effort)."""
+    path = _entry_path(key)
+    entry = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "cached_at": datetime.now(timezone.utc).isoformat(),
+        "model": model,
+        "result": result,
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+    except (OSError, TypeError) as e:
+        # Cache write failure must never fail the pipeline
+        logger.warning(f"Failed to write cache entry {key[:12]}: {e}")
+
+
+async def get_or_call(
+    key_parts: tuple,
+    async_fn: Callable[[], Awaitable[Any]],
+    validate: Callable[[Any], bool] | None = None,
+    model: str = "",
+) -> Any:
+    """
+    Return the cached result for key_parts, or invoke async_fn and cache it.
+
+    Args:
+        key_parts: Call identity tuple (provider, model, prompt_version, input)
+        async_fn: Zero-arg coroutine factory performing the LLM call
+        validate: Optional predicate; stale hits are evicted and re-fetched
+        model: Model name stored as entry metadata
+
+    Returns:
+        The (possibly cached) result
+    """
+    key = cache_key(key_parts)
+
+    cached = get_cached(key, validate=validate)
+    if cached is not None:
+        logger.debug(f"LLM cache hit: {key[:12]}")
+        return cached
+
+    result = await async_fn()
+    if result is not None:
+        put_cached(key, result, model=model)
+    return result
+
+
+def clear_cache() -> int:
+    """Remove all cache entries. Returns the number deleted."""
+    if not CACHE_DIR.exists():
+        return 0
+    deleted = 0
+    for path in CACHE_DIR.glob("*/*.json"):
+        path.unlink(missing_ok=True)
+        deleted += 1
+    return deleted
@@ -6,6 +6,7 @@ Models are loaded once and reused across all pipeline steps.
 
 import os
 from functools import lru_cache
+from typing import Any, Callable
 
 import httpx
 from loguru import logger
@@ -155,9 +156,14 @@ class LLMClient:
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
-                    # Rate limited, wait and retry
+                    # Rate limited, wait and retry; tell the active
+                    # concurrency controller to shrink its window
                     import asyncio
 
+                    from core.concurrency import notify_rate_limited
+
+                    notify_rate_limited()
+
                     wait_time = 2**attempt
                     logger.warning(f"Rate limited, waiting {wait_time}s...")
                     await asyncio.sleep(wait_time)
@@ -238,6 +244,67 @@ def get_llm_client(model: str) -> LLMClient:
     return _llm_clients[model]
 
 
+# Correction rounds after a response fails parsing/validation (network
+# retries are handled separately inside LLMClient.complete)
+PARSE_FEEDBACK_MAX_RETRIES = 2
+
+
+async def call_with_feedback(
+    llm: LLMClient,
+    messages: list[dict],
+    parse: Callable[[str], Any],
+    max_retries: int = PARSE_FEEDBACK_MAX_RETRIES,
+    temperature: float = 0.1,
+) -> Any | None:
+    """
+    Call the LLM and parse the response, feeding parse errors back.
+
+    Instead of discarding a malformed response (or re-sending the full
+    prompt from scratch), the failing output and its parse error are
+    appended to the conversation and the model is asked to self-correct.
+    A correction turn costs a fraction of a fresh full-context call.
+
+    Args:
+        llm: LLM client to dispatch on
+        messages: Initial conversation
+        parse: Parser over the response text; raises ValueError on
+               malformed output (the message is sent back to the model)
+        max_retries: Correction rounds after the initial attempt
+        temperature: Sampling temperature
+
+    Returns:
+        The parsed result, or None if every attempt failed to parse
+    """
+    import asyncio
+
+    conversation = messages
+
+    for attempt in range(max_retries + 1):
+        response = await llm.complete(conversation, temperature=temperature)
+        text = str(response)
+        try:
+            return parse(text)
+        except ValueError as e:
+            if attempt >= max_retries:
+                logger.warning(
+                    f"Response still malformed after {max_retries} "
+                    f"correction rounds: {e}"
+                )
+                return None
+            logger.debug(f"Malformed response (attempt {attempt + 1}): {e}")
+            conversation = conversation + [
+                {"role": "assistant", "content": text},
+                {
+                    "role": "user",
+                    "content": (
+                        f"Your previous output failed validation: {e}. "
+                        "Reply again with ONLY the corrected JSON."
+                    ),
+                },
+            ]
+            await asyncio.sleep(1.0 * (attempt + 1))
+
+
 async def close_all_llm_clients() -> None:
     """Close all LLM client connections."""
     global _llm_clients
@@ -246,6 +313,28 @@ async def close_all_llm_clients() -> None:
     _llm_clients = {}
 
 
+def _close_clients_at_exit() -> None:
+    """Close pooled clients at interpreter shutdown.
+
+    Clients are kept open across pipeline runs for connection reuse,
+    so cleanup happens once per process instead of once per run.
+    """
+    if not _llm_clients:
+        return
+    import asyncio
+
+    try:
+        asyncio.run(close_all_llm_clients())
+    except RuntimeError:
+        # Event loop already closed/running during shutdown - nothing to do
+        pass
+
+
+import atexit
+
+atexit.register(_close_clients_at_exit)
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -13,6 +13,18 @@ DATA_DIR = PROJECT_ROOT / "data"
 LIVE_DIR = DATA_DIR / "_live"
 SEED_DIR = DATA_DIR / "_seed"
 
+# Precomputed string forms: `LIVE_DIR / name` allocates a fresh PosixPath
+# per call, which adds up in per-request path construction (cache lookups,
+# export loops). Hot paths should join on these instead.
+DATA_DIR_STR = str(DATA_DIR)
+LIVE_DIR_STR = str(LIVE_DIR)
+SEED_DIR_STR = str(SEED_DIR)
+
+
+def live_path(name: str) -> str:
+    """Fast string path for a file under LIVE_DIR (no Path allocation)."""
+    return f"{LIVE_DIR_STR}/{name}"
+
 # =============================================================================
 # External API URLs
 # =============================================================================
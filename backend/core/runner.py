@@ -20,16 +20,17 @@ Usage:
 
 import asyncio
 import json
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 from loguru import logger
 
-from core.models import close_all_llm_clients
+from core.concurrency import AdaptiveSemaphore, register_controller
 from core.state import export_live_data, load_state
 from core.steps.expand import expand_all_to_pairs, expand_to_pairs
 from core.steps.fetch import fetch_events
 from core.steps.groups import build_groups, extract_markets_from_groups
-from core.steps.implications_parallel import extract_implications_parallel as extract_implications_batch
+from core.steps.implications import extract_implications_batch
 from core.steps.portfolios import build_and_save_portfolios
 from core.steps.validate import validate_pairs
 
@@ -79,7 +80,9 @@ async def run_async(
     Returns:
         Dict with run statistics
     """
-    start_time = datetime.now(timezone.utc)
+    # Monotonic clock for elapsed time: immune to wall-clock adjustments
+    # and avoids allocating tz-aware datetimes just to diff them
+    start_time = time.perf_counter()
 
     # Create tracker if not provided (with quiet mode support)
     tracker = step_tracker or StepTracker(quiet=quiet)
@@ -118,7 +121,11 @@ async def run_async(
         # STEP 2: Build market groups
         # =====================================================================
         with tracker.step(2, "Build Groups"):
-            groups, groups_summary = build_groups(all_events)
+            # Pure-CPU step: run in the process pool so the loop stays free
+            loop = asyncio.get_running_loop()
+            groups, groups_summary = await loop.run_in_executor(
+                _get_cpu_pool(), build_groups, all_events
+            )
             tracker.update_details(
                 f"{groups_summary['groups_count']} groups, "
                 f"{groups_summary['total_markets']} markets"
@@ -148,14 +155,16 @@ async def run_async(
                 # Update prices in existing portfolios
                 from core.steps.portfolios import update_portfolio_prices
 
-                # Build price updates from groups
-                price_updates = {}
-                for group in groups:
-                    for market in group.get("markets", []):
-                        price_updates[market["id"]] = {
-                            "price_yes": market.get("price_yes", 0.5),
-                            "price_no": market.get("price_no", 0.5),
-                        }
+                # Build price updates from groups in a single comprehension
+                # pass (no per-iteration method lookups / dict resizing)
+                price_updates = {
+                    market["id"]: {
+                        "price_yes": market.get("price_yes", 0.5),
+                        "price_no": market.get("price_no", 0.5),
+                    }
+                    for group in groups
+                    for market in group.get("markets", [])
+                }
 
                 portfolios, price_summary = update_portfolio_prices(
                     state, price_updates
@@ -164,7 +173,7 @@ async def run_async(
 
                 state.complete_run(run_id, len(all_events), 0, "completed")
 
-                elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
+                elapsed = time.perf_counter() - start_time
                 result = {
                     "mode": "price_update",
                     "total_events": len(all_events),
@@ -181,14 +190,25 @@ async def run_async(
             tracker.print_skip("No new groups and no existing portfolios")
             return {"mode": "skipped", "reason": "no_portfolios"}
 
+        # Shared AIMD concurrency controller for both LLM steps (4 and 6).
+        # They hit the same provider rate limit, so one adaptive window
+        # keeps it saturated without tripping 429s.
+        llm_semaphore = AdaptiveSemaphore(int(os.getenv("LLM_MAX_CONCURRENT", "10")))
+        register_controller(llm_semaphore)
+
         # =====================================================================
         # STEP 4: Extract implications (LLM, CACHED)
         # =====================================================================
         with tracker.step(4, "Find Implications"):
-            # Use the parallel implementation for 10x speed
+            # Batched parallel extraction; persists new results to state
+            # and returns the combined (new + cached) implications so the
+            # incremental expansion below sees existing targets too
             implications = await extract_implications_batch(
                 groups=new_groups,
-                max_concurrent=int(os.getenv("LLM_MAX_CONCURRENT", "10"))
+                all_groups=groups,
+                state=state,
+                semaphore=llm_semaphore,
+                llm_model=impl_model,
             )
 
             total_yes = sum(len(i.get("yes_covered_by", [])) for i in implications)
@@ -203,9 +223,10 @@ async def run_async(
         # =====================================================================
         with tracker.step(5, "Expand Pairs"):
             if full:
-                # Full expansion without cache check
-                candidate_pairs, expand_summary = expand_all_to_pairs(
-                    implications, groups
+                # Full expansion without cache check (pure-CPU, offloaded;
+                # the incremental path below reads state and stays on-loop)
+                candidate_pairs, expand_summary = await loop.run_in_executor(
+                    _get_cpu_pool(), expand_all_to_pairs, implications, groups
                 )
             else:
                 # Incremental two-way expansion
@@ -234,6 +255,7 @@ async def run_async(
                     state=state,
                     llm_model=val_model,
                     progress_callback=tracker.update_details,
+                    semaphore=llm_semaphore,
                 )
 
             retention = validate_summary.get("retention_rate", 0)
@@ -277,7 +299,7 @@ async def run_async(
         # Complete run
         state.complete_run(run_id, len(all_events), len(new_groups), "completed")
 
-        elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
+        elapsed = time.perf_counter() - start_time
 
         result = {
             "mode": "full" if full else "incremental",
@@ -301,8 +323,9 @@ async def run_async(
         raise
 
     finally:
-        # Cleanup LLM clients
-        await close_all_llm_clients()
+        # LLM/HTTP clients stay open for connection reuse across runs;
+        # they are closed at process exit (see core.models atexit hook)
+        register_controller(None)
         state.close()
 
 
@@ -328,7 +351,7 @@ def run(
     Returns:
         Dict with run statistics
     """
-    return asyncio.run(
+    return _get_event_loop().run_until_complete(
         run_async(
             full=full,
             step_tracker=step_tracker,
@@ -340,6 +363,36 @@ def run(
     )
 
 
+# Shared worker pool for pure-CPU steps (group building, full expansion).
+# Offloading them keeps the event loop free so background I/O (WebSocket
+# broadcasts, in-flight LLM calls) is not starved during CPU bursts.
+# Only state-free steps with picklable inputs go here; steps bound to the
+# SQLite-backed PipelineState stay on the loop thread.
+_cpu_pool: ProcessPoolExecutor | None = None
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    """Get (or lazily create) the shared CPU worker pool."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = ProcessPoolExecutor()
+    return _cpu_pool
+
+
+# Long-lived event loop shared across run() invocations. Tearing the loop
+# down per run would also tear down the pooled HTTP/LLM clients, paying
+# TLS + DNS cold-start on every pipeline trigger.
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get (or lazily create) the persistent pipeline event loop."""
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
 # =============================================================================
 # CLI ENTRY POINT
 # =============================================================================
@@ -9,12 +9,18 @@ Manages:
 - Current market prices
 """
 
-import json
+import hashlib
+import os
 import sqlite3
+import time
+import zlib
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
 
+import orjson
 from loguru import logger
 
 # =============================================================================
@@ -33,6 +39,190 @@ EVENTS_PATH = LIVE_DIR / "events.json"
 # Seed data path
 SEED_DATA_PATH = SEED_DIR / "seed.json"
 
+# =============================================================================
+# HOT-PATH SQL
+# =============================================================================
+
+# Hoisted to module level so every call passes the identical string object
+# to sqlite3's prepared-statement LRU (keyed by the SQL text), guaranteeing
+# hits on the lookups that run in tight loops during pair expansion.
+
+_GET_GROUP_SQL = "SELECT data FROM groups WHERE group_id = ?"
+
+_GET_METADATA_SQL = "SELECT value FROM metadata WHERE key = ?"
+
+_ALL_COVERS_SQL = """
+    SELECT group_id, side, cover_group_id, title, cover_position, relationship,
+           relationship_type, probability, counterexample_attempt
+    FROM implication_covers
+"""
+
+_INSERT_COVER_SQL = """
+    INSERT OR REPLACE INTO implication_covers
+    (group_id, side, cover_group_id, title, cover_position, relationship,
+     relationship_type, probability, counterexample_attempt)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_GET_VALIDATED_PAIR_SQL = """
+    SELECT pair_id, target_group_id, target_market_id, target_position,
+           cover_group_id, cover_market_id, cover_position,
+           cover_probability, viability_score, is_valid, validation_reason,
+           validated_at, llm_model
+    FROM validated_pairs WHERE pair_id = ?
+"""
+
+
+# =============================================================================
+# TIMESTAMPS
+# =============================================================================
+
+# The write paths only need second resolution, so the ISO string is
+# memoized per second — constructing and formatting a tz-aware datetime
+# on every add_*/update_* call is measurable across thousands of rows.
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (memoized per second)."""
+    global _now_iso_cache
+    sec = int(time.time())
+    if _now_iso_cache[0] != sec:
+        _now_iso_cache = (
+            sec,
+            datetime.fromtimestamp(sec, timezone.utc).isoformat(),
+        )
+    return _now_iso_cache[1]
+
+
+# =============================================================================
+# DATA COLUMN PACKING
+# =============================================================================
+
+# The full group/portfolio dicts carry fields beyond the flat columns
+# (nested markets, metrics, relationship text), so the data column stays —
+# but stored compressed: ~4x fewer bytes written and paged back in.
+
+
+def _rows_as_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Materialize cursor rows as dicts (column names resolved once)."""
+    cols = [d[0] for d in cursor.description]
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+def _iter_rows(cursor: sqlite3.Cursor, arraysize: int = 1000) -> Iterator[tuple]:
+    """
+    Stream cursor rows in fetchmany batches.
+
+    Plain cursor iteration crosses the sqlite3 C boundary once per row;
+    batched fetchmany amortizes that to once per thousand rows while
+    keeping memory bounded (unlike fetchall on a large table).
+    """
+    cursor.arraysize = arraysize
+    while batch := cursor.fetchmany():
+        yield from batch
+
+
+def _pack_data(obj: dict) -> bytes:
+    """Serialize + compress a dict for a data column (fast zlib level)."""
+    return zlib.compress(orjson.dumps(obj), 1)
+
+
+def _unpack_data(blob: bytes | str) -> dict:
+    """Parse a data column written either compressed or as legacy JSON text."""
+    if isinstance(blob, str) or blob[:1] in (b"{", b"["):
+        return orjson.loads(blob)
+    return orjson.loads(zlib.decompress(blob))
+
+
+# =============================================================================
+# ROW BUILDERS
+# =============================================================================
+
+# Module-level builders keep row construction out of the bulk writers so
+# executemany can be fed a lazy generator (no intermediate N-row list).
+# Plain functions rather than itemgetter: most of these fields are
+# genuinely optional and need defaults.
+
+
+def _group_row(g: dict, now: str) -> tuple:
+    return (
+        g["group_id"],
+        g.get("title", ""),
+        g.get("slug", ""),
+        g.get("partition_type", ""),
+        g.get("embedding_text", ""),
+        _pack_data(g),
+        now,
+    )
+
+
+def _market_row(m: dict, now: str) -> tuple:
+    return (
+        m["id"],
+        m.get("group_id", ""),
+        m.get("question", ""),
+        m.get("price_yes", 0.5),
+        m.get("price_no", 0.5),
+        m.get("resolution_date"),
+        m.get("bracket_label"),
+        now,
+    )
+
+
+def _implication_row(impl: dict, now: str, llm_model: str) -> tuple:
+    return (
+        impl["group_id"],
+        impl.get("title", ""),
+        orjson.dumps(impl.get("yes_covered_by", [])),
+        orjson.dumps(impl.get("no_covered_by", [])),
+        now,
+        llm_model,
+    )
+
+
+_PAIR_KEYS = (
+    "pair_id",
+    "target_group_id",
+    "target_market_id",
+    "target_position",
+    "cover_group_id",
+    "cover_market_id",
+    "cover_position",
+    "cover_probability",
+    "viability_score",
+    "is_valid",
+    "validation_reason",
+    "validated_at",
+    "llm_model",
+)
+
+
+def _pair_entry(row: tuple) -> dict:
+    """Materialize a validated_pairs row (column order of _PAIR_KEYS)."""
+    pair = dict(zip(_PAIR_KEYS, row))
+    # NULL predates the is_valid migration and means "valid"
+    pair["is_valid"] = row[9] in (1, None)
+    return pair
+
+
+def _validated_pair_row(p: dict, now: str, llm_model: str) -> tuple:
+    return (
+        p["pair_id"],
+        p.get("target_group_id", ""),
+        p["target_market_id"],
+        p["target_position"],
+        p.get("cover_group_id", ""),
+        p["cover_market_id"],
+        p["cover_position"],
+        p.get("cover_probability", 0.0),
+        p.get("viability_score", 0.0),
+        1 if p.get("is_valid", True) else 0,  # Store as integer
+        p.get("validation_reason", ""),
+        now,
+        llm_model,
+    )
+
 
 # =============================================================================
 # DATA CLASSES
@@ -69,12 +259,54 @@ class PipelineState:
         self.live_dir = self.db_path.parent
         self.live_dir.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        # cached_statements: every hot query (is_pair_validated,
+        # get_portfolios, add_groups, ...) reuses its prepared statement
+        # instead of re-parsing SQL; the default cache of 128 is too small
+        # for the pipeline's statement mix plus per-run temp-table DDL.
+        # isolation_level IMMEDIATE: transactions take the write lock at
+        # BEGIN instead of on first write, so a writer never hits
+        # SQLITE_BUSY halfway through a batch while readers are active
+        # No row_factory: sqlite3.Row objects cost ~3x a bare tuple to
+        # construct and every read path here indexes positionally anyway;
+        # the few dict-shaped reads go through _rows_as_dicts
+        self.conn = sqlite3.connect(
+            self.db_path, cached_statements=256, isolation_level="IMMEDIATE"
+        )
+        # WAL + synchronous=NORMAL: commits no longer fsync the journal on
+        # every small batch write (add_groups, update_market_prices, ...),
+        # and readers don't block the writer. Durability drops from FULL
+        # to NORMAL — a crash can lose the last commit — which is fine for
+        # a rebuildable pipeline cache. busy_timeout covers the API server
+        # and pipeline sharing the DB. mmap_size: read pages straight from
+        # the OS page cache without copies into SQLite's heap; cache_size
+        # -65536 = 64 MiB page cache; temp_store MEMORY keeps temp tables
+        # (group-id diffing) off disk.
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA busy_timeout = 30000;
+            PRAGMA mmap_size = 1073741824;
+            PRAGMA cache_size = -65536;
+            PRAGMA temp_store = MEMORY;
+            """
+        )
         self._init_tables()
 
-        # In-memory cache for fast access during pipeline run
+        # In-memory caches for fast access during pipeline run
         self._processed_group_ids_cache: set[str] | None = None
+        # Validated-pair set is stable within a run (only add_validated_pairs
+        # extends it), so membership checks and row fetches are served from
+        # memory after the first touch instead of hitting SQLite per pair
+        self._validated_pair_ids: set[str] | None = None
+        self._validated_pair_cache: dict[str, dict | None] = {}
+        # True once the cache holds every stored pair (bulk-loaded on the
+        # first get_validated_pair call)
+        self._validated_pair_cache_complete = False
+        # Implications are read-hot ("CACHED FOREVER", probed per market
+        # pair) — mirrored into RAM on first access, written through on add
+        self._implication_cache: dict[str, dict] = {}
+        self._implication_cache_complete = False
 
         # Auto-import seed data if database is empty
         self._import_seed_if_empty()
@@ -121,9 +353,25 @@ class PipelineState:
                 FOREIGN KEY (group_id) REFERENCES groups(group_id)
             );
 
+            -- Normalized implication covers (one row per cover). The JSON
+            -- columns above are still written during the migration window,
+            -- but reads come from here — no per-row JSON parse.
+            CREATE TABLE IF NOT EXISTS implication_covers (
+                group_id TEXT,
+                side TEXT CHECK(side IN ('yes', 'no')),
+                cover_group_id TEXT,
+                title TEXT,
+                cover_position TEXT,
+                relationship TEXT,
+                relationship_type TEXT,
+                probability REAL,
+                counterexample_attempt TEXT,
+                PRIMARY KEY (group_id, side, cover_group_id)
+            );
+
             -- Validated market pairs (LLM validated - CACHED)
             CREATE TABLE IF NOT EXISTS validated_pairs (
-                pair_id TEXT PRIMARY KEY,  -- hash(target_market_id + cover_market_id + position)
+                pair_id TEXT PRIMARY KEY,  -- md5-16 of target/cover market ids + positions (expand.generate_pair_id)
                 target_group_id TEXT,
                 target_market_id TEXT,
                 target_position TEXT,      -- 'YES' or 'NO'
@@ -195,13 +443,52 @@ class PipelineState:
             self.conn.commit()
             logger.info("Migration: Added is_valid column to validated_pairs")
 
+        # Migration 2: Backfill implication_covers from the JSON columns
+        # (one-time parse for databases created before normalization)
+        covers_count = self.conn.execute(
+            "SELECT COUNT(*) FROM implication_covers"
+        ).fetchone()[0]
+        impl_count = self.conn.execute("SELECT COUNT(*) FROM implications").fetchone()[0]
+        if impl_count and not covers_count:
+            rows = []
+            cursor = self.conn.execute(
+                "SELECT group_id, yes_covered_by, no_covered_by FROM implications"
+            )
+            for group_id, yes_json, no_json in cursor.fetchall():
+                for side, blob in (("yes", yes_json), ("no", no_json)):
+                    for cover in orjson.loads(blob) if blob else []:
+                        rows.append(self._cover_row(group_id, side, cover))
+            with self.conn:
+                self.conn.executemany(_INSERT_COVER_SQL, rows)
+            logger.info(f"Migration: Backfilled {len(rows)} implication covers")
+
+        # Migration 3: Partial covering index over the hot validated-pairs
+        # read (the iter_all_validated_pairs filter). Created here rather
+        # than in _init_tables because it references is_valid, which
+        # Migration 1 may have just added. Only qualifying rows are
+        # indexed, and every selected column is included, so the read is
+        # answered from the index without table probes.
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_validated_pairs_hot
+            ON validated_pairs(
+                viability_score DESC, pair_id, target_group_id,
+                target_market_id, target_position, cover_group_id,
+                cover_market_id, cover_position, cover_probability,
+                is_valid, validation_reason, validated_at, llm_model
+            )
+            WHERE viability_score >= 0.9 AND (is_valid = 1 OR is_valid IS NULL)
+            """
+        )
+        self.conn.commit()
+
     # =========================================================================
     # RUN MANAGEMENT
     # =========================================================================
 
     def start_run(self, run_type: str) -> int:
         """Start a new pipeline run, return run ID."""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
         cursor = self.conn.execute(
             """
             INSERT INTO runs (run_type, started_at, status)
@@ -220,7 +507,7 @@ class PipelineState:
         status: str = "completed",
     ) -> None:
         """Mark a run as completed."""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
         self.conn.execute(
             """
             UPDATE runs
@@ -251,8 +538,8 @@ class PipelineState:
             )
         else:
             cursor = self.conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1")
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        rows = _rows_as_dicts(cursor)
+        return rows[0] if rows else None
 
     def get_orphaned_runs(self) -> list[dict]:
         """
@@ -267,11 +554,11 @@ class PipelineState:
             ORDER BY id DESC
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _rows_as_dicts(cursor)
 
     def mark_run_failed(self, run_id: int, reason: str = "crashed") -> None:
         """Mark a run as failed (used for orphaned run cleanup)."""
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
         self.conn.execute(
             """
             UPDATE runs
@@ -311,77 +598,129 @@ class PipelineState:
         return self._processed_group_ids_cache
 
     def get_new_group_ids(self, all_ids: list[str]) -> set[str]:
-        """Get group IDs that haven't been processed yet."""
-        processed = self.get_processed_group_ids()
-        return set(all_ids) - processed
+        """
+        Get group IDs that haven't been processed yet.
+
+        The diff runs inside SQLite (temp table + EXCEPT) so one bulk
+        roundtrip replaces pulling every known group_id into Python.
+        Small batches skip the temp table via a VALUES expression.
+        """
+        if not all_ids:
+            return set()
+        if len(all_ids) <= 500:
+            placeholders = ",".join("(?)" for _ in all_ids)
+            cursor = self.conn.execute(
+                f"VALUES {placeholders} EXCEPT SELECT group_id FROM groups",
+                all_ids,
+            )
+            return {row[0] for row in cursor.fetchall()}
+        # Own the transaction: the temp-table writes would otherwise open
+        # an implicit BEGIN that stays pending until an unrelated later
+        # commit, holding the write lock across the call boundary
+        with self.conn:
+            self.conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _incoming_groups (gid TEXT PRIMARY KEY)"
+            )
+            self.conn.execute("DELETE FROM _incoming_groups")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO _incoming_groups VALUES (?)",
+                ((gid,) for gid in all_ids),
+            )
+            cursor = self.conn.execute(
+                "SELECT gid FROM _incoming_groups EXCEPT SELECT group_id FROM groups"
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def iter_all_groups(self) -> Iterator[dict]:
+        """
+        Stream all processed groups straight off the cursor.
+
+        Avoids holding raw JSON bytes and parsed dicts for the whole
+        table at once; callers that don't need a list should prefer this.
+        """
+        cursor = self.conn.execute("SELECT data FROM groups")
+        for row in _iter_rows(cursor):
+            yield _unpack_data(row[0])
 
     def get_all_groups(self) -> list[dict]:
         """Get all processed groups."""
-        cursor = self.conn.execute("SELECT data FROM groups")
-        return [json.loads(row[0]) for row in cursor.fetchall()]
+        return list(self.iter_all_groups())
 
     def get_group(self, group_id: str) -> dict | None:
         """Get a single group by ID."""
-        cursor = self.conn.execute(
-            "SELECT data FROM groups WHERE group_id = ?", (group_id,)
-        )
+        cursor = self.conn.execute(_GET_GROUP_SQL, (group_id,))
         row = cursor.fetchone()
-        return json.loads(row[0]) if row else None
+        return _unpack_data(row[0]) if row else None
 
-    def add_groups(self, groups: list[dict]) -> None:
-        """Add new processed groups."""
-        now = datetime.now(timezone.utc).isoformat()
-        self.conn.executemany(
-            """
-            INSERT OR REPLACE INTO groups
-            (group_id, title, slug, partition_type, embedding_text, data, processed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    g["group_id"],
-                    g.get("title", ""),
-                    g.get("slug", ""),
-                    g.get("partition_type", ""),
-                    g.get("embedding_text", ""),
-                    json.dumps(g),
-                    now,
-                )
-                for g in groups
-            ],
-        )
-        self.conn.commit()
-        self._processed_group_ids_cache = None
+    def add_groups(self, groups: list[dict], replace: bool = True) -> None:
+        """
+        Add new processed groups.
+
+        Args:
+            groups: Group dicts to store
+            replace: Upsert (default); pass False on known-fresh tables
+                     (seed import) to skip the conflict handling
+        """
+        now = _utc_now_iso()
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        with self.conn:
+            self.conn.executemany(
+                f"""
+                {verb} INTO groups
+                (group_id, title, slug, partition_type, embedding_text, data, processed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (_group_row(g, now) for g in groups),
+            )
+        # Extend the id cache incrementally instead of invalidating it —
+        # dropping it here forced a full re-scan on every add/check cycle
+        if self._processed_group_ids_cache is not None:
+            self._processed_group_ids_cache.update(g["group_id"] for g in groups)
 
     # =========================================================================
     # MARKET MANAGEMENT
     # =========================================================================
 
-    def add_markets(self, markets: list[dict]) -> None:
-        """Add or update markets with current prices."""
-        now = datetime.now(timezone.utc).isoformat()
-        self.conn.executemany(
+    def add_markets(self, markets: Iterable[dict], replace: bool = True) -> None:
+        """
+        Add or update markets with current prices.
+
+        Accepts any iterable (including generators) and streams rows
+        into a single executemany transaction — constant memory even
+        for very large market sets.
+        """
+        now = _utc_now_iso()
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        with self.conn:
+            self.conn.executemany(
+                f"""
+                {verb} INTO markets
+                (market_id, group_id, question, price_yes, price_no,
+                 resolution_date, bracket_label, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (_market_row(m, now) for m in markets),
+            )
+
+    def iter_all_markets(self) -> Iterator[dict]:
+        """Stream markets as pipeline-shaped dicts straight off the cursor."""
+        cursor = self.conn.execute(
+            """
+            SELECT market_id, group_id, question, price_yes, price_no,
+                   resolution_date, bracket_label
+            FROM markets
             """
-            INSERT OR REPLACE INTO markets
-            (market_id, group_id, question, price_yes, price_no,
-             resolution_date, bracket_label, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    m["id"],
-                    m.get("group_id", ""),
-                    m.get("question", ""),
-                    m.get("price_yes", 0.5),
-                    m.get("price_no", 0.5),
-                    m.get("resolution_date"),
-                    m.get("bracket_label"),
-                    now,
-                )
-                for m in markets
-            ],
         )
-        self.conn.commit()
+        for row in _iter_rows(cursor):
+            yield {
+                "id": row[0],
+                "group_id": row[1],
+                "question": row[2],
+                "price_yes": row[3],
+                "price_no": row[4],
+                "resolution_date": row[5],
+                "bracket_label": row[6],
+            }
 
     def update_market_prices(self, prices: dict[str, dict]) -> None:
         """
@@ -390,96 +729,142 @@ class PipelineState:
         Args:
             prices: Dict of market_id -> {price_yes, price_no}
         """
-        now = datetime.now(timezone.utc).isoformat()
-        for market_id, price_data in prices.items():
-            self.conn.execute(
+        now = _utc_now_iso()
+        # One executemany in one transaction: the statement is prepared
+        # once and the row loop runs in C instead of N Python execute calls
+        with self.conn:
+            self.conn.executemany(
                 """
                 UPDATE markets
                 SET price_yes = ?, price_no = ?, last_updated = ?
                 WHERE market_id = ?
                 """,
                 (
-                    price_data.get("price_yes", 0.5),
-                    price_data.get("price_no", 0.5),
-                    now,
-                    market_id,
+                    (
+                        price_data.get("price_yes", 0.5),
+                        price_data.get("price_no", 0.5),
+                        now,
+                        market_id,
+                    )
+                    for market_id, price_data in prices.items()
                 ),
             )
-        self.conn.commit()
 
     # =========================================================================
     # IMPLICATION MANAGEMENT (CACHED)
     # =========================================================================
 
+    @staticmethod
+    def _cover_row(group_id: str, side: str, cover: dict) -> tuple:
+        """Flatten a cover dict into an implication_covers row."""
+        return (
+            group_id,
+            side,
+            cover.get("group_id", ""),
+            cover.get("title", ""),
+            cover.get("cover_position", ""),
+            cover.get("relationship", ""),
+            cover.get("relationship_type", ""),
+            cover.get("probability", 0.0),
+            cover.get("counterexample_attempt", ""),
+        )
+
+    @staticmethod
+    def _cover_entry(row: tuple) -> dict:
+        """Rebuild a cover dict from an implication_covers row tail."""
+        return {
+            "group_id": row[0],
+            "title": row[1],
+            "cover_position": row[2],
+            "relationship": row[3],
+            "relationship_type": row[4],
+            "probability": row[5],
+            "counterexample_attempt": row[6],
+        }
+
     def get_implication(self, group_id: str) -> dict | None:
         """Get cached implication for a group."""
+        if not self._implication_cache_complete:
+            # One bulk load replaces the two SQL probes (base row +
+            # covers) this method used to issue per call; add_implications
+            # writes through, so the mirror stays authoritative
+            self._implication_cache = {
+                impl["group_id"]: impl for impl in self.iter_all_implications()
+            }
+            self._implication_cache_complete = True
+        return self._implication_cache.get(group_id)
+
+    def iter_all_implications(self) -> Iterator[dict]:
+        """Stream all cached implications straight off the cursor."""
+        # One pass over the normalized covers, then one over the base
+        # rows — no per-row JSON parsing
+        yes_covers: dict[str, list[dict]] = {}
+        no_covers: dict[str, list[dict]] = {}
+        for row in _iter_rows(self.conn.execute(_ALL_COVERS_SQL)):
+            target = yes_covers if row[1] == "yes" else no_covers
+            target.setdefault(row[0], []).append(self._cover_entry(row[2:]))
+
         cursor = self.conn.execute(
-            """
-            SELECT group_id, title, yes_covered_by, no_covered_by,
-                   extracted_at, llm_model
-            FROM implications WHERE group_id = ?
-            """,
-            (group_id,),
+            "SELECT group_id, title, extracted_at, llm_model FROM implications"
         )
-        row = cursor.fetchone()
-        if row:
-            return {
+        for row in _iter_rows(cursor):
+            yield {
                 "group_id": row[0],
                 "title": row[1],
-                "yes_covered_by": json.loads(row[2]) if row[2] else [],
-                "no_covered_by": json.loads(row[3]) if row[3] else [],
-                "extracted_at": row[4],
-                "llm_model": row[5],
+                "yes_covered_by": yes_covers.get(row[0], []),
+                "no_covered_by": no_covers.get(row[0], []),
+                "extracted_at": row[2],
+                "llm_model": row[3],
             }
-        return None
 
     def get_all_implications(self) -> list[dict]:
         """Get all cached implications."""
-        cursor = self.conn.execute(
-            """
-            SELECT group_id, title, yes_covered_by, no_covered_by,
-                   extracted_at, llm_model
-            FROM implications
-            """
-        )
-        return [
-            {
-                "group_id": row[0],
-                "title": row[1],
-                "yes_covered_by": json.loads(row[2]) if row[2] else [],
-                "no_covered_by": json.loads(row[3]) if row[3] else [],
-                "extracted_at": row[4],
-                "llm_model": row[5],
-            }
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_all_implications())
 
-    def add_implications(self, implications: list[dict], llm_model: str) -> None:
+    def add_implications(
+        self, implications: list[dict], llm_model: str, replace: bool = True
+    ) -> None:
         """
         Add LLM-extracted implications (CACHED FOREVER).
 
         These are immutable - once extracted, they never change.
         """
-        now = datetime.now(timezone.utc).isoformat()
-        self.conn.executemany(
-            """
-            INSERT OR REPLACE INTO implications
-            (group_id, title, yes_covered_by, no_covered_by, extracted_at, llm_model)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            [
+        now = _utc_now_iso()
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        with self.conn:
+            self.conn.executemany(
+                f"""
+                {verb} INTO implications
+                (group_id, title, yes_covered_by, no_covered_by, extracted_at, llm_model)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (_implication_row(impl, now, llm_model) for impl in implications),
+            )
+            # Mirror covers into the normalized table (reads come from
+            # here; the JSON columns remain for the migration window)
+            self.conn.executemany(
+                "DELETE FROM implication_covers WHERE group_id = ?",
+                [(impl["group_id"],) for impl in implications],
+            )
+            self.conn.executemany(
+                _INSERT_COVER_SQL,
                 (
-                    impl["group_id"],
-                    impl.get("title", ""),
-                    json.dumps(impl.get("yes_covered_by", [])),
-                    json.dumps(impl.get("no_covered_by", [])),
-                    now,
-                    llm_model,
-                )
-                for impl in implications
-            ],
-        )
-        self.conn.commit()
+                    self._cover_row(impl["group_id"], side, cover)
+                    for impl in implications
+                    for side, key in (("yes", "yes_covered_by"), ("no", "no_covered_by"))
+                    for cover in impl.get(key, [])
+                ),
+            )
+        if self._implication_cache_complete:
+            for impl in implications:
+                self._implication_cache[impl["group_id"]] = {
+                    "group_id": impl["group_id"],
+                    "title": impl.get("title", ""),
+                    "yes_covered_by": impl.get("yes_covered_by", []),
+                    "no_covered_by": impl.get("no_covered_by", []),
+                    "extracted_at": now,
+                    "llm_model": llm_model,
+                }
 
     # =========================================================================
     # VALIDATED PAIRS MANAGEMENT (CACHED)
@@ -487,37 +872,41 @@ class PipelineState:
 
     def get_validated_pair(self, pair_id: str) -> dict | None:
         """Get cached validated pair."""
+        if pair_id in self._validated_pair_cache:
+            return self._validated_pair_cache[pair_id]
+        if not self._validated_pair_cache_complete:
+            # Portfolio assembly probes dozens of pairs per target; one
+            # bulk scan on the first miss beats a SQL roundtrip per probe
+            self._load_validated_pair_cache()
+            if pair_id in self._validated_pair_cache:
+                return self._validated_pair_cache[pair_id]
+        pair = self._fetch_validated_pair(pair_id)
+        self._validated_pair_cache[pair_id] = pair
+        return pair
+
+    def _load_validated_pair_cache(self) -> None:
+        """Bulk-load every stored pair into the in-memory cache."""
         cursor = self.conn.execute(
             """
             SELECT pair_id, target_group_id, target_market_id, target_position,
                    cover_group_id, cover_market_id, cover_position,
                    cover_probability, viability_score, is_valid, validation_reason,
                    validated_at, llm_model
-            FROM validated_pairs WHERE pair_id = ?
-            """,
-            (pair_id,),
+            FROM validated_pairs
+            """
         )
+        cache = self._validated_pair_cache
+        for row in _iter_rows(cursor):
+            cache[row[0]] = _pair_entry(row)
+        self._validated_pair_cache_complete = True
+
+    def _fetch_validated_pair(self, pair_id: str) -> dict | None:
+        cursor = self.conn.execute(_GET_VALIDATED_PAIR_SQL, (pair_id,))
         row = cursor.fetchone()
-        if row:
-            return {
-                "pair_id": row[0],
-                "target_group_id": row[1],
-                "target_market_id": row[2],
-                "target_position": row[3],
-                "cover_group_id": row[4],
-                "cover_market_id": row[5],
-                "cover_position": row[6],
-                "cover_probability": row[7],
-                "viability_score": row[8],
-                "is_valid": bool(row[9]) if row[9] is not None else True,
-                "validation_reason": row[10],
-                "validated_at": row[11],
-                "llm_model": row[12],
-            }
-        return None
+        return _pair_entry(row) if row else None
 
-    def get_all_validated_pairs(self) -> list[dict]:
-        """Get all cached validated pairs (only valid ones)."""
+    def iter_all_validated_pairs(self) -> Iterator[dict]:
+        """Stream all cached validated pairs (only valid ones)."""
         cursor = self.conn.execute(
             """
             SELECT pair_id, target_group_id, target_market_id, target_position,
@@ -528,68 +917,50 @@ class PipelineState:
             WHERE viability_score >= 0.9 AND (is_valid = 1 OR is_valid IS NULL)
             """
         )
-        return [
-            {
-                "pair_id": row[0],
-                "target_group_id": row[1],
-                "target_market_id": row[2],
-                "target_position": row[3],
-                "cover_group_id": row[4],
-                "cover_market_id": row[5],
-                "cover_position": row[6],
-                "cover_probability": row[7],
-                "viability_score": row[8],
-                "is_valid": bool(row[9]) if row[9] is not None else True,
-                "validation_reason": row[10],
-                "validated_at": row[11],
-                "llm_model": row[12],
-            }
-            for row in cursor.fetchall()
-        ]
+        for row in _iter_rows(cursor):
+            yield _pair_entry(row)
+
+    def get_all_validated_pairs(self) -> list[dict]:
+        """Get all cached validated pairs (only valid ones)."""
+        return list(self.iter_all_validated_pairs())
 
-    def add_validated_pairs(self, pairs: list[dict], llm_model: str) -> None:
+    def add_validated_pairs(
+        self, pairs: list[dict], llm_model: str, replace: bool = True
+    ) -> None:
         """
         Add LLM-validated pairs (CACHED).
 
         These are immutable - once validated, they never change.
         """
-        now = datetime.now(timezone.utc).isoformat()
-        self.conn.executemany(
-            """
-            INSERT OR REPLACE INTO validated_pairs
-            (pair_id, target_group_id, target_market_id, target_position,
-             cover_group_id, cover_market_id, cover_position,
-             cover_probability, viability_score, is_valid, validation_reason,
-             validated_at, llm_model)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    p["pair_id"],
-                    p.get("target_group_id", ""),
-                    p["target_market_id"],
-                    p["target_position"],
-                    p.get("cover_group_id", ""),
-                    p["cover_market_id"],
-                    p["cover_position"],
-                    p.get("cover_probability", 0.0),
-                    p.get("viability_score", 0.0),
-                    1 if p.get("is_valid", True) else 0,  # Store as integer
-                    p.get("validation_reason", ""),
-                    now,
-                    llm_model,
-                )
-                for p in pairs
-            ],
-        )
-        self.conn.commit()
+        now = _utc_now_iso()
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        with self.conn:
+            self.conn.executemany(
+                f"""
+                {verb} INTO validated_pairs
+                (pair_id, target_group_id, target_market_id, target_position,
+                 cover_group_id, cover_market_id, cover_position,
+                 cover_probability, viability_score, is_valid, validation_reason,
+                 validated_at, llm_model)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (_validated_pair_row(p, now, llm_model) for p in pairs),
+            )
+
+        # Keep the in-memory caches coherent: extend the id set
+        # incrementally (no full reload) and drop any per-pair entries so
+        # the next get re-reads the authoritative row
+        if self._validated_pair_ids is not None:
+            self._validated_pair_ids.update(p["pair_id"] for p in pairs)
+        for p in pairs:
+            self._validated_pair_cache.pop(p["pair_id"], None)
 
     def is_pair_validated(self, pair_id: str) -> bool:
         """Check if a pair is already validated (cached)."""
-        cursor = self.conn.execute(
-            "SELECT 1 FROM validated_pairs WHERE pair_id = ?", (pair_id,)
-        )
-        return cursor.fetchone() is not None
+        if self._validated_pair_ids is None:
+            cursor = self.conn.execute("SELECT pair_id FROM validated_pairs")
+            self._validated_pair_ids = {row[0] for row in cursor.fetchall()}
+        return pair_id in self._validated_pair_ids
 
     # =========================================================================
     # PORTFOLIO MANAGEMENT
@@ -599,63 +970,63 @@ class PipelineState:
         """Get all portfolios (alias for get_all_portfolios)."""
         return self.get_all_portfolios()
 
+    def iter_all_portfolios(self) -> Iterator[dict]:
+        """Stream all portfolios straight off the cursor."""
+        cursor = self.conn.execute("SELECT data FROM portfolios")
+        for row in _iter_rows(cursor):
+            yield _unpack_data(row[0])
+
     def get_all_portfolios(self) -> list[dict]:
         """Get all portfolios."""
-        cursor = self.conn.execute("SELECT data FROM portfolios")
-        return [json.loads(row[0]) for row in cursor.fetchall()]
+        return list(self.iter_all_portfolios())
 
     def save_portfolios(self, portfolios: list[dict]) -> None:
         """Save portfolios (replaces all existing)."""
-        now = datetime.now(timezone.utc).isoformat()
-
-        # Deduplicate by pair_id (keep first occurrence, which has best coverage due to sorting)
-        seen_ids: set[str] = set()
-        unique_portfolios = []
-        for p in portfolios:
-            pair_id = p.get("pair_id", "")
-            if pair_id and pair_id not in seen_ids:
-                seen_ids.add(pair_id)
-                unique_portfolios.append(p)
-
-        if len(unique_portfolios) < len(portfolios):
-            logger.warning(
-                f"Deduplicated portfolios: {len(portfolios)} -> {len(unique_portfolios)}"
+        now = _utc_now_iso()
+
+        # Delete + insert share one immediate transaction: a failure
+        # mid-insert rolls the delete back, and readers never observe a
+        # half-replaced portfolio set. Dedup by pair_id happens in SQLite:
+        # portfolio_id IS the pair_id primary key, and INSERT OR IGNORE
+        # keeps the first occurrence (best coverage, since portfolios
+        # arrive tier-sorted) — no Python pre-pass or set allocation.
+        with self.conn:
+            self.conn.execute("DELETE FROM portfolios")
+            cursor = self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO portfolios
+                (portfolio_id, target_market_id, target_position, target_price,
+                 cover_market_id, cover_position, cover_price,
+                 total_cost, coverage, expected_profit, tier, tier_label,
+                 last_updated, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    (
+                        p.get("pair_id", f"p_{i}"),
+                        p["target_market_id"],
+                        p["target_position"],
+                        p.get("target_price", 0),
+                        p["cover_market_id"],
+                        p["cover_position"],
+                        p.get("cover_price", 0),
+                        p["total_cost"],
+                        p["coverage"],
+                        p["expected_profit"],
+                        p["tier"],
+                        p.get("tier_label", ""),
+                        now,
+                        _pack_data(p),
+                    )
+                    for i, p in enumerate(portfolios)
+                ),
             )
+            inserted = cursor.rowcount
 
-        # Clear existing
-        self.conn.execute("DELETE FROM portfolios")
-
-        # Insert new
-        self.conn.executemany(
-            """
-            INSERT INTO portfolios
-            (portfolio_id, target_market_id, target_position, target_price,
-             cover_market_id, cover_position, cover_price,
-             total_cost, coverage, expected_profit, tier, tier_label,
-             last_updated, data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    p.get("pair_id", f"p_{i}"),
-                    p["target_market_id"],
-                    p["target_position"],
-                    p.get("target_price", 0),
-                    p["cover_market_id"],
-                    p["cover_position"],
-                    p.get("cover_price", 0),
-                    p["total_cost"],
-                    p["coverage"],
-                    p["expected_profit"],
-                    p["tier"],
-                    p.get("tier_label", ""),
-                    now,
-                    json.dumps(p),
-                )
-                for i, p in enumerate(unique_portfolios)
-            ],
-        )
-        self.conn.commit()
+        if 0 <= inserted < len(portfolios):
+            logger.warning(
+                f"Deduplicated portfolios: {len(portfolios)} -> {inserted}"
+            )
 
     # =========================================================================
     # METADATA
@@ -663,7 +1034,7 @@ class PipelineState:
 
     def get_metadata(self, key: str) -> str | None:
         """Get a metadata value."""
-        cursor = self.conn.execute("SELECT value FROM metadata WHERE key = ?", (key,))
+        cursor = self.conn.execute(_GET_METADATA_SQL, (key,))
         row = cursor.fetchone()
         return row[0] if row else None
 
@@ -681,24 +1052,27 @@ class PipelineState:
 
     def get_stats(self) -> StateStats:
         """Get current state statistics."""
-        groups_count = self.conn.execute("SELECT COUNT(*) FROM groups").fetchone()[0]
-        implications_count = self.conn.execute(
-            "SELECT COUNT(*) FROM implications"
-        ).fetchone()[0]
-        validated_pairs_count = self.conn.execute(
-            "SELECT COUNT(*) FROM validated_pairs"
-        ).fetchone()[0]
-        portfolios_count = self.conn.execute(
-            "SELECT COUNT(*) FROM portfolios"
-        ).fetchone()[0]
+        # One statement instead of six round-trips (4 counts + 2 metadata
+        # reads) — stats are polled by the dashboard
+        row = self.conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM groups),
+                (SELECT COUNT(*) FROM implications),
+                (SELECT COUNT(*) FROM validated_pairs),
+                (SELECT COUNT(*) FROM portfolios),
+                (SELECT value FROM metadata WHERE key = 'last_full_run'),
+                (SELECT value FROM metadata WHERE key = 'last_refresh_run')
+            """
+        ).fetchone()
 
         return StateStats(
-            total_groups=groups_count,
-            total_implications=implications_count,
-            total_validated_pairs=validated_pairs_count,
-            total_portfolios=portfolios_count,
-            last_full_run=self.get_metadata("last_full_run"),
-            last_refresh=self.get_metadata("last_refresh_run"),
+            total_groups=row[0],
+            total_implications=row[1],
+            total_validated_pairs=row[2],
+            total_portfolios=row[3],
+            last_full_run=row[4],
+            last_refresh=row[5],
         )
 
     def reset(self) -> None:
@@ -710,6 +1084,7 @@ class PipelineState:
             DELETE FROM metadata;
             DELETE FROM groups;
             DELETE FROM implications;
+            DELETE FROM implication_covers;
             DELETE FROM validated_pairs;
             DELETE FROM portfolios;
             DELETE FROM markets;
@@ -719,6 +1094,11 @@ class PipelineState:
 
         # Clear caches
         self._processed_group_ids_cache = None
+        self._validated_pair_ids = None
+        self._validated_pair_cache = {}
+        self._validated_pair_cache_complete = False
+        self._implication_cache = {}
+        self._implication_cache_complete = False
 
         # Remove _live files
         for path in [GROUPS_PATH, PORTFOLIOS_PATH]:
@@ -766,53 +1146,54 @@ class PipelineState:
         """
         logger.info("Exporting seed data...")
 
-        # Fetch all tables
-        groups = self.get_all_groups()
-        implications = self.get_all_implications()
-        validated_pairs = self.get_all_validated_pairs()
-
-        # Get markets directly from DB
-        cursor = self.conn.execute(
+        # Counts come from SQL (the pair count mirrors the filter in
+        # iter_all_validated_pairs) so _meta can be written before the
+        # tables are streamed
+        counts_row = self.conn.execute(
             """
-            SELECT market_id, group_id, question, price_yes, price_no,
-                   resolution_date, bracket_label
-            FROM markets
+            SELECT
+                (SELECT COUNT(*) FROM groups),
+                (SELECT COUNT(*) FROM implications),
+                (SELECT COUNT(*) FROM validated_pairs
+                 WHERE viability_score >= 0.9 AND (is_valid = 1 OR is_valid IS NULL)),
+                (SELECT COUNT(*) FROM markets)
             """
-        )
-        markets = [
-            {
-                "id": row[0],
-                "group_id": row[1],
-                "question": row[2],
-                "price_yes": row[3],
-                "price_no": row[4],
-                "resolution_date": row[5],
-                "bracket_label": row[6],
-            }
-            for row in cursor.fetchall()
-        ]
+        ).fetchone()
+        counts = {
+            "groups": counts_row[0],
+            "implications": counts_row[1],
+            "validated_pairs": counts_row[2],
+            "markets": counts_row[3],
+        }
 
-        seed_data = {
-            "_meta": {
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "description": "Seed data for pipeline bootstrap",
-                "counts": {
-                    "groups": len(groups),
-                    "implications": len(implications),
-                    "validated_pairs": len(validated_pairs),
-                    "markets": len(markets),
-                },
-            },
-            "groups": groups,
-            "implications": implications,
-            "validated_pairs": validated_pairs,
-            "markets": markets,
+        meta = {
+            "exported_at": _utc_now_iso(),
+            "description": "Seed data for pipeline bootstrap",
+            "counts": counts,
         }
 
-        # Create seed directory and write file
+        # Stream each table row-by-row from its cursor: peak memory is one
+        # row, not the whole DB serialized twice (mega-dict + JSON string)
         try:
             SEED_DIR.mkdir(parents=True, exist_ok=True)
-            SEED_DATA_PATH.write_text(json.dumps(seed_data, indent=2))
+            tmp_path = SEED_DATA_PATH.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(b'{\n"_meta": ')
+                f.write(orjson.dumps(meta))
+                for name, rows in (
+                    ("groups", self.iter_all_groups()),
+                    ("implications", self.iter_all_implications()),
+                    ("validated_pairs", self.iter_all_validated_pairs()),
+                    ("markets", self.iter_all_markets()),
+                ):
+                    f.write(f',\n"{name}": ['.encode())
+                    for i, row in enumerate(rows):
+                        if i:
+                            f.write(b",\n")
+                        f.write(orjson.dumps(row))
+                    f.write(b"]")
+                f.write(b"\n}\n")
+            os.replace(tmp_path, SEED_DATA_PATH)
         except OSError as e:
             logger.error(f"Failed to export seed data: {e}")
             return {"status": "error", "reason": f"write_failed: {e}"}
@@ -820,17 +1201,14 @@ class PipelineState:
         result = {
             "status": "exported",
             "path": str(SEED_DATA_PATH),
-            "groups": len(groups),
-            "implications": len(implications),
-            "validated_pairs": len(validated_pairs),
-            "markets": len(markets),
+            **counts,
         }
 
         logger.info(
-            f"Exported seed: {len(groups)} groups, "
-            f"{len(implications)} implications, "
-            f"{len(validated_pairs)} pairs, "
-            f"{len(markets)} markets → {SEED_DATA_PATH}"
+            f"Exported seed: {counts['groups']} groups, "
+            f"{counts['implications']} implications, "
+            f"{counts['validated_pairs']} pairs, "
+            f"{counts['markets']} markets → {SEED_DATA_PATH}"
         )
 
         return result
@@ -861,37 +1239,59 @@ class PipelineState:
 
         # Load seed file
         try:
-            seed_data = json.loads(SEED_DATA_PATH.read_text())
-        except (json.JSONDecodeError, OSError) as e:
+            seed_data = orjson.loads(SEED_DATA_PATH.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to load seed data: {e}")
             return {"status": "error", "reason": f"invalid_seed_file: {e}"}
 
+        # Validate the shape once upfront so a malformed file fails fast
+        # here instead of partway through the bulk insert
+        if not isinstance(seed_data, dict):
+            logger.error("Seed file root is not an object")
+            return {"status": "error", "reason": "invalid_seed_file: not an object"}
+
         # Import in order (respects foreign key relationships)
         groups = seed_data.get("groups", [])
         implications = seed_data.get("implications", [])
         validated_pairs = seed_data.get("validated_pairs", [])
         markets = seed_data.get("markets", [])
+        for name, table in (
+            ("groups", groups),
+            ("implications", implications),
+            ("validated_pairs", validated_pairs),
+            ("markets", markets),
+        ):
+            if not isinstance(table, list):
+                logger.error(f"Seed field '{name}' is not a list")
+                return {"status": "error", "reason": f"invalid_seed_file: {name}"}
+
+        # Bulk-load mode: the tables are empty (checked above) and fully
+        # rebuildable from the seed file, so conflict handling (plain
+        # INSERT instead of OR REPLACE) and journaling/fsync buy nothing
+        self.conn.executescript(
+            "PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;"
+        )
+        try:
+            if groups:
+                self.add_groups(groups, replace=False)
 
-        if groups:
-            self.add_groups(groups)
-
-        if markets:
-            self.add_markets(markets)
+            if markets:
+                self.add_markets(markets, replace=False)
 
-        if implications:
-            # Use llm_model from first implication or "seed" as fallback
-            llm_model = (
-                implications[0].get("llm_model", "seed") if implications else "seed"
-            )
-            self.add_implications(implications, llm_model=llm_model)
+            if implications:
+                # Use llm_model from first implication or "seed" as fallback
+                llm_model = implications[0].get("llm_model", "seed")
+                self.add_implications(implications, llm_model=llm_model, replace=False)
 
-        if validated_pairs:
-            llm_model = (
-                validated_pairs[0].get("llm_model", "seed")
-                if validated_pairs
-                else "seed"
+            if validated_pairs:
+                llm_model = validated_pairs[0].get("llm_model", "seed")
+                self.add_validated_pairs(
+                    validated_pairs, llm_model=llm_model, replace=False
+                )
+        finally:
+            self.conn.executescript(
+                "PRAGMA journal_mode = WAL; PRAGMA synchronous = NORMAL;"
             )
-            self.add_validated_pairs(validated_pairs, llm_model=llm_model)
 
         result = {
             "status": "imported",
@@ -931,6 +1331,56 @@ def load_state() -> PipelineState:
     return PipelineState()
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes atomically: temp file in the same directory + os.replace.
+
+    API consumers reading the _live/ files never observe a partial write.
+    The temp name carries the pid so concurrent exporters (API server +
+    manual pipeline run) can't clobber each other's in-flight file, and
+    a failed write doesn't leave a stale .tmp behind.
+    """
+    tmp_path = Path(f"{path}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _content_digest(data: bytes) -> str:
+    """Short content hash used to detect unchanged exports."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _is_unchanged(path: Path, digest: str) -> bool:
+    """True if path exists and its .hash sidecar matches digest."""
+    try:
+        return path.exists() and Path(f"{path}.hash").read_text() == digest
+    except OSError:
+        return False
+
+
+def _write_with_digest(path: Path, data: bytes, digest: str) -> None:
+    """Atomically write data plus the .hash sidecar for the next export."""
+    _atomic_write_bytes(path, data)
+    _atomic_write_bytes(Path(f"{path}.hash"), digest.encode())
+
+
+def _dumps_live(obj: dict | list) -> bytes:
+    """
+    Serialize a _live payload.
+
+    Compact by default — the files are API-consumed, and indentation
+    inflates both encoder time and output size by ~30%. Set
+    PRETTY_LIVE_JSON=1 to get indented output for eyeballing locally.
+    """
+    if os.getenv("PRETTY_LIVE_JSON"):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return orjson.dumps(obj)
+
+
 def export_live_data(
     state: PipelineState,
     groups: list[dict],
@@ -945,50 +1395,72 @@ def export_live_data(
         groups: List of market groups
         portfolios: List of covering portfolios
     """
-    export_timestamp = datetime.now(timezone.utc).isoformat()
+    export_timestamp = _utc_now_iso()
+
+    # Content hashes cover the payload (not the _meta wrapper, whose
+    # exported_at changes every run): when the payload matches the .hash
+    # sidecar from the previous export, the multi-MB rewrite is skipped.
+    # On the no-new-groups price_update path groups/events are usually
+    # untouched, so only portfolios.json hits disk.
 
     # Groups with metadata
-    groups_data = {
-        "_meta": {
-            "exported_at": export_timestamp,
-            "count": len(groups),
-            "total_markets": sum(len(g.get("markets", [])) for g in groups),
-            "source": "pipeline",
-        },
-        "groups": groups,
-    }
-    GROUPS_PATH.write_text(json.dumps(groups_data, indent=2))
+    groups_digest = _content_digest(orjson.dumps(groups))
+    if _is_unchanged(GROUPS_PATH, groups_digest):
+        logger.debug("groups.json content unchanged, skipping write")
+    else:
+        groups_data = {
+            "_meta": {
+                "exported_at": export_timestamp,
+                "count": len(groups),
+                # `or ()` avoids allocating a fresh default list per group
+                "total_markets": sum(len(g.get("markets") or ()) for g in groups),
+                "source": "pipeline",
+            },
+            "groups": groups,
+        }
+        _write_with_digest(GROUPS_PATH, _dumps_live(groups_data), groups_digest)
 
     # Portfolios with metadata
-    tier_counts = {}
-    profitable_count = 0
-    for p in portfolios:
-        tier = p.get("tier", 4)
-        tier_counts[f"tier_{tier}"] = tier_counts.get(f"tier_{tier}", 0) + 1
-        if p.get("expected_profit", 0) > 0:
-            profitable_count += 1
-
-    portfolios_data = {
-        "_meta": {
-            "exported_at": export_timestamp,
-            "count": len(portfolios),
-            "by_tier": tier_counts,
-            "profitable_count": profitable_count,
-            "tier_thresholds": {
-                "tier_1": ">=95% coverage",
-                "tier_2": ">=90% coverage",
-                "tier_3": ">=85% coverage",
-                "tier_4": "<85% coverage",
+    portfolios_digest = _content_digest(orjson.dumps(portfolios))
+    if _is_unchanged(PORTFOLIOS_PATH, portfolios_digest):
+        logger.debug("portfolios.json content unchanged, skipping write")
+    else:
+        # Counter aggregates in C; tier labels are formatted once per
+        # tier instead of once per portfolio
+        tier_counter = Counter(p.get("tier", 4) for p in portfolios)
+        tier_counts = {f"tier_{t}": n for t, n in sorted(tier_counter.items())}
+        profitable_count = sum(
+            1 for p in portfolios if p.get("expected_profit", 0) > 0
+        )
+
+        portfolios_data = {
+            "_meta": {
+                "exported_at": export_timestamp,
+                "count": len(portfolios),
+                "by_tier": tier_counts,
+                "profitable_count": profitable_count,
+                "tier_thresholds": {
+                    "tier_1": ">=95% coverage",
+                    "tier_2": ">=90% coverage",
+                    "tier_3": ">=85% coverage",
+                    "tier_4": "<85% coverage",
+                },
+                "source": "pipeline",
             },
-            "source": "pipeline",
-        },
-        "portfolios": portfolios,
-    }
-    PORTFOLIOS_PATH.write_text(json.dumps(portfolios_data, indent=2))
+            "portfolios": portfolios,
+        }
+        _write_with_digest(
+            PORTFOLIOS_PATH, _dumps_live(portfolios_data), portfolios_digest
+        )
 
     # Export events if provided
     if events:
-        EVENTS_PATH.write_text(json.dumps(events, indent=2))
+        events_bytes = _dumps_live(events)
+        events_digest = _content_digest(events_bytes)
+        if _is_unchanged(EVENTS_PATH, events_digest):
+            logger.debug("events.json content unchanged, skipping write")
+        else:
+            _write_with_digest(EVENTS_PATH, events_bytes, events_digest)
 
     logger.info(
         f"Exported to _live/: {len(groups)} groups, {len(portfolios)} portfolios "
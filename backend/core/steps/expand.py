@@ -92,12 +92,16 @@ def generate_pair_id(
     """
     Generate unique pair ID for caching.
 
-    Uses hash of components to ensure uniqueness.
+    16 hex chars of md5 over the pair components: stable across
+    processes (validated_pairs is keyed by this forever, so the scheme
+    must not change) and short enough to keep the primary-key B-tree
+    compact. Not a security hash — flagged as such so hardened builds
+    don't route it through a slower FIPS provider.
     """
     components = (
         f"{target_market_id}:{target_position}:{cover_market_id}:{cover_position}"
     )
-    return hashlib.md5(components.encode()).hexdigest()[:16]
+    return hashlib.md5(components.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
 # =============================================================================
@@ -185,6 +189,29 @@ def expand_implication_to_pairs(
 
     target_group_slug = target_group.get("slug", "")
 
+    # Materialize cover markets ONCE per implication (not once per target
+    # market). Cover lists are identical for every target market, so the
+    # old per-market get_cover_markets calls redid the same group lookups,
+    # probability filtering, and dict building N_target times. The inner
+    # loop now walks flat precomputed rows.
+    yes_cover_markets = [
+        cm
+        for cover_info in yes_covering_groups
+        for cm in get_cover_markets(cover_info, groups_by_id, target_group_id)
+    ]
+
+    # NO covers are skipped for mutually exclusive groups where NO on one
+    # bracket doesn't mean NO on the group outcome (e.g., candidates)
+    no_cover_markets = (
+        []
+        if skip_no_expansion
+        else [
+            cm
+            for cover_info in no_covering_groups
+            for cm in get_cover_markets(cover_info, groups_by_id, target_group_id)
+        ]
+    )
+
     for target_market in target_group.get("markets", []):
         target_market_id = target_market["id"]
         target_market_slug = target_market.get("slug", "")
@@ -194,12 +221,17 @@ def expand_implication_to_pairs(
         target_price_no = target_market.get("price_no", 0.5)
         target_bracket = target_market.get("bracket_label")
 
-        # Expand YES covers (for target_YES position)
-        for cover_info in yes_covering_groups:
-            cover_markets = get_cover_markets(cover_info, groups_by_id, target_group_id)
+        # Expand YES covers (target_YES) and NO covers (target_NO)
+        for target_position, target_price, cover_markets in (
+            ("YES", target_price_yes, yes_cover_markets),
+            ("NO", target_price_no, no_cover_markets),
+        ):
             for cm in cover_markets:
                 pair_id = generate_pair_id(
-                    target_market_id, "YES", cm["market_id"], cm["cover_position"]
+                    target_market_id,
+                    target_position,
+                    cm["market_id"],
+                    cm["cover_position"],
                 )
                 pairs.append(
                     {
@@ -210,9 +242,9 @@ def expand_implication_to_pairs(
                         "target_market_id": target_market_id,
                         "target_market_slug": target_market_slug,
                         "target_question": target_question,
-                        "target_position": "YES",
+                        "target_position": target_position,
                         "target_resolution": target_resolution,
-                        "target_price": target_price_yes,
+                        "target_price": target_price,
                         "target_bracket": target_bracket,
                         "cover_group_id": cm["source_group_id"],
                         "cover_group_title": cm["source_group_title"],
@@ -231,48 +263,6 @@ def expand_implication_to_pairs(
                     }
                 )
 
-        # Expand NO covers (for target_NO position)
-        # Skip for mutually exclusive groups where NO on one bracket
-        # doesn't mean NO on the group outcome (e.g., candidates)
-        if not skip_no_expansion:
-            for cover_info in no_covering_groups:
-                cover_markets = get_cover_markets(
-                    cover_info, groups_by_id, target_group_id
-                )
-                for cm in cover_markets:
-                    pair_id = generate_pair_id(
-                        target_market_id, "NO", cm["market_id"], cm["cover_position"]
-                    )
-                    pairs.append(
-                        {
-                            "pair_id": pair_id,
-                            "target_group_id": target_group_id,
-                            "target_group_title": target_title,
-                            "target_group_slug": target_group_slug,
-                            "target_market_id": target_market_id,
-                            "target_market_slug": target_market_slug,
-                            "target_question": target_question,
-                            "target_position": "NO",
-                            "target_resolution": target_resolution,
-                            "target_price": target_price_no,
-                            "target_bracket": target_bracket,
-                            "cover_group_id": cm["source_group_id"],
-                            "cover_group_title": cm["source_group_title"],
-                            "cover_group_slug": cm["source_group_slug"],
-                            "cover_market_id": cm["market_id"],
-                            "cover_market_slug": cm["market_slug"],
-                            "cover_question": cm["question"],
-                            "cover_position": cm["cover_position"],
-                            "cover_resolution": cm["resolution_date"],
-                            "cover_price_yes": cm["price_yes"],
-                            "cover_price_no": cm["price_no"],
-                            "cover_bracket": cm["bracket_label"],
-                            "cover_probability": cm["probability"],
-                            "relationship": cm["relationship"],
-                            "relationship_type": cm["relationship_type"],
-                        }
-                    )
-
     return pairs
 
 
@@ -309,6 +299,13 @@ def expand_to_pairs(
     new_pairs = []
     cached_pairs = []
 
+    # Dedupe on the precomputed pair_id digest. Duplicate implications
+    # (e.g. the same cover group listed under both positions, or repeated
+    # records for a group) would otherwise send identical pairs to
+    # validation twice. Hashing the short hex id is far cheaper than
+    # hashing a tuple of the underlying market-id strings.
+    seen_pair_ids: set[str] = set()
+
     # Determine which pairs to generate based on new groups
     if new_group_ids:
         logger.info(
@@ -320,6 +317,9 @@ def expand_to_pairs(
             if impl["group_id"] in new_group_ids:
                 pairs = expand_implication_to_pairs(impl, groups_by_id)
                 for p in pairs:
+                    if p["pair_id"] in seen_pair_ids:
+                        continue
+                    seen_pair_ids.add(p["pair_id"])
                     if state.is_pair_validated(p["pair_id"]):
                         cached_pairs.append(p)
                     else:
@@ -344,6 +344,9 @@ def expand_to_pairs(
                     for p in pairs:
                         # Only include pairs where cover is from new group
                         if p["cover_group_id"] in new_group_ids:
+                            if p["pair_id"] in seen_pair_ids:
+                                continue
+                            seen_pair_ids.add(p["pair_id"])
                             if state.is_pair_validated(p["pair_id"]):
                                 cached_pairs.append(p)
                             else:
@@ -355,6 +358,9 @@ def expand_to_pairs(
         for impl in implications:
             pairs = expand_implication_to_pairs(impl, groups_by_id)
             for p in pairs:
+                if p["pair_id"] in seen_pair_ids:
+                    continue
+                seen_pair_ids.add(p["pair_id"])
                 if state.is_pair_validated(p["pair_id"]):
                     cached_pairs.append(p)
                 else:
@@ -406,10 +412,14 @@ def expand_all_to_pairs(
     groups_by_id = {g["group_id"]: g for g in groups}
 
     all_pairs = []
+    seen_pair_ids: set[str] = set()
 
     for impl in implications:
-        pairs = expand_implication_to_pairs(impl, groups_by_id)
-        all_pairs.extend(pairs)
+        for p in expand_implication_to_pairs(impl, groups_by_id):
+            if p["pair_id"] in seen_pair_ids:
+                continue
+            seen_pair_ids.add(p["pair_id"])
+            all_pairs.append(p)
 
     # Compute stats (compute set once for efficiency and safety)
     yes_pairs = len([p for p in all_pairs if p["target_position"] == "YES"])
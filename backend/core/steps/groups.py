@@ -24,6 +24,7 @@ Partition types:
 
 import re
 from dataclasses import asdict, dataclass, field
+from typing import Iterator
 
 from loguru import logger
 
@@ -449,21 +450,23 @@ def build_groups(events: list[dict]) -> tuple[list[dict], dict]:
     return groups_data, summary
 
 
-def extract_markets_from_groups(groups: list[dict]) -> list[dict]:
+def extract_markets_from_groups(groups: list[dict]) -> Iterator[dict]:
     """
-    Extract flat list of markets from groups for state storage.
+    Stream markets from groups for state storage.
+
+    Yields one market dict at a time so large event sets flow straight
+    into the bulk insert without materializing a full list.
 
     Args:
         groups: List of group dicts
 
-    Returns:
-        List of market dicts with group_id added
+    Yields:
+        Market dicts with group_id added
     """
-    markets = []
     for group in groups:
         group_id = group["group_id"]
         for market in group.get("markets", []):
-            market_dict = {
+            yield {
                 "id": market["id"],
                 "group_id": group_id,
                 "question": market.get("question", ""),
@@ -473,5 +476,3 @@ def extract_markets_from_groups(groups: list[dict]) -> list[dict]:
                 "price_no": market.get("price_no", 0.5),
                 "resolution_date": market.get("resolution_date"),
             }
-            markets.append(market_dict)
-    return markets
@@ -20,12 +20,13 @@ How it works:
     3. So buying NO on "other" covers a YES position on "target"
 """
 
-import asyncio
 from typing import Callable
 
 from loguru import logger
 
-from core.models import get_llm_client
+from core import llm_cache
+from core.concurrency import AdaptiveSemaphore
+from core.models import call_with_feedback, get_llm_client
 from core.state import PipelineState
 from core.utils import extract_json_from_response
 
@@ -33,6 +34,12 @@ from core.utils import extract_json_from_response
 # CONFIGURATION
 # =============================================================================
 
+# LLM provider (part of the content-addressed cache key)
+LLM_PROVIDER = "openrouter"
+
+# Bump whenever IMPLICATION_PROMPT changes (invalidates cached responses)
+PROMPT_VERSION = 1
+
 # Probability for necessary relationships
 NECESSARY_PROBABILITY = 0.98
 
@@ -120,6 +127,84 @@ For EACH relationship, you MUST:
 """
 
 
+MULTI_IMPLICATION_PROMPT = """Find ONLY logically necessary relationships between prediction market events.
+
+Analyze EACH target event below INDEPENDENTLY against the available events.
+
+## TARGET EVENTS:
+{targets_text}
+
+## AVAILABLE EVENTS:
+{group_titles_text}
+
+## WHAT IS "NECESSARY"?
+
+A **NECESSARY** implication (A → B) means: "If A is true, B MUST be true BY DEFINITION OR PHYSICAL LAW."
+
+There must be ZERO possible scenarios where A=YES and B=NO. Not "unlikely" - IMPOSSIBLE.
+
+## VALID NECESSARY RELATIONSHIPS (include these):
+- "election held" → "election called" (DEFINITION: can't hold without calling)
+- "city captured" → "military operation in city" (PHYSICAL: can't capture without entering)
+- "person dies" → "person was alive" (LOGICAL: death requires prior life)
+
+## NOT NECESSARY - DO NOT INCLUDE:
+- "war started" → "peace talks failed" (WRONG: war can start without talks)
+- "election called" → "election held" (WRONG: can be cancelled)
+- "sanctions imposed" → "conflict worsens" (WRONG: correlation, not causation)
+
+## YOUR TASK
+
+For EACH target event, find relationships where events GUARANTEE each other:
+
+### 1. implied_by (OTHER → TARGET): What GUARANTEES the target?
+- "If OTHER=YES, then TARGET=YES is 100% CERTAIN"
+
+### 2. implies (TARGET → OTHER): What does the target GUARANTEE?
+- "If TARGET=YES, then OTHER=YES is 100% CERTAIN"
+- BE VERY CAREFUL: This direction is often confused with correlation!
+
+## STRICT COUNTEREXAMPLE TEST (REQUIRED)
+
+For EACH relationship, try to construct a violating scenario. If you can
+imagine ANY such scenario (even unlikely), DO NOT INCLUDE IT.
+
+## OUTPUT FORMAT (JSON only):
+```json
+{{
+  "results": [
+    {{
+      "target_title": "exact target title from list",
+      "implied_by": [
+        {{
+          "group_title": "exact title from list",
+          "explanation": "why other=YES makes target=YES logically certain",
+          "counterexample_attempt": "I tried to imagine [scenario] but it's impossible because [reason]"
+        }}
+      ],
+      "implies": [
+        {{
+          "group_title": "exact title from list",
+          "explanation": "why target=YES makes other=YES logically certain",
+          "counterexample_attempt": "I tried to imagine [scenario] but it's impossible because [reason]"
+        }}
+      ]
+    }}
+  ]
+}}
+```
+
+Include one results entry PER TARGET EVENT, in the same order, even if both lists are empty.
+
+## CRITICAL RULES:
+1. QUALITY OVER QUANTITY - empty lists are fine, false positives are NOT
+2. "Likely" or "usually" means DO NOT INCLUDE
+3. Correlations are NOT implications - "A often leads to B" is NOT "A guarantees B"
+4. Political/social predictions are almost NEVER necessary (humans are unpredictable)
+5. When in doubt, LEAVE IT OUT
+"""
+
+
 # =============================================================================
 # LLM HELPERS
 # =============================================================================
@@ -224,6 +309,128 @@ def derive_covers(
     }
 
 
+def is_implication_record(result: dict) -> bool:
+    """Check a cached result still matches the implication record shape."""
+    return (
+        isinstance(result, dict)
+        and isinstance(result.get("group_id"), str)
+        and isinstance(result.get("yes_covered_by"), list)
+        and isinstance(result.get("no_covered_by"), list)
+    )
+
+
+def is_implication_records(results: list) -> bool:
+    """Check a cached result is a list of implication records."""
+    return isinstance(results, list) and all(
+        is_implication_record(r) for r in results
+    )
+
+
+# =============================================================================
+# MULTI-GROUP EXTRACTION
+# =============================================================================
+
+
+def empty_implication(target_group: dict) -> dict:
+    """Implication record with no covers (parse failure / no relationships)."""
+    return {
+        "group_id": target_group["group_id"],
+        "title": target_group["title"],
+        "yes_covered_by": [],
+        "no_covered_by": [],
+    }
+
+
+def build_multi_prompt(target_groups: list[dict], group_titles_text: str) -> str:
+    """Build the multi-target prompt (separated so callers can prefetch)."""
+    targets_text = "\n".join(
+        f"{i}. {g['title']}" for i, g in enumerate(target_groups, 1)
+    )
+    return MULTI_IMPLICATION_PROMPT.format(
+        targets_text=targets_text,
+        group_titles_text=group_titles_text,
+    )
+
+
+async def extract_implications_multi(
+    target_groups: list[dict],
+    group_titles_text: str,
+    groups_by_title: dict[str, dict],
+    groups_by_title_lower: dict[str, dict],
+    llm,
+    model_name: str,
+    prompt: str | None = None,
+) -> list[dict]:
+    """
+    Extract implications for several target groups in ONE LLM request.
+
+    Packing N targets into one prompt amortizes the shared context (the
+    available-events list dominates token count) and cuts request count
+    by ~N. Results are matched back to targets by title, falling back to
+    positional order.
+
+    Returns:
+        One implication record per target group (empty covers on failure)
+    """
+    if prompt is None:
+        prompt = build_multi_prompt(target_groups, group_titles_text)
+
+    key = llm_cache.cache_key((LLM_PROVIDER, model_name, PROMPT_VERSION, prompt))
+    cached = llm_cache.get_cached(key, validate=is_implication_records)
+    if cached is not None:
+        return cached
+
+    def parse_results(text: str) -> dict:
+        llm_result = extract_json_from_response(text)
+        if not llm_result or not isinstance(llm_result.get("results"), list):
+            raise ValueError("expected a JSON object with a 'results' array")
+        return llm_result
+
+    try:
+        # On malformed output the parse error is fed back to the model
+        # for self-correction rather than discarding the whole chunk
+        llm_result = await call_with_feedback(
+            llm,
+            [{"role": "user", "content": prompt}],
+            parse_results,
+            temperature=0.1,
+        )
+    except Exception as e:
+        logger.error(f"Multi-group extraction failed ({len(target_groups)} targets): {e}")
+        return [empty_implication(g) for g in target_groups]
+
+    if llm_result is None:
+        logger.warning("Failed to parse multi-group LLM response")
+        return [empty_implication(g) for g in target_groups]
+
+    # Match result entries back to target groups by title
+    targets_by_title = {g["title"]: g for g in target_groups}
+    targets_by_title_lower = {g["title"].lower().strip(): g for g in target_groups}
+
+    records: dict[str, dict] = {}
+    entries = llm_result["results"]
+    for i, entry in enumerate(entries):
+        matched = match_title_to_group(
+            entry.get("target_title", ""),
+            targets_by_title,
+            targets_by_title_lower,
+        )
+        if matched is None and i < len(target_groups):
+            matched = target_groups[i]  # Positional fallback
+        if matched is None:
+            continue
+
+        records[matched["group_id"]] = derive_covers(
+            entry, matched, groups_by_title, groups_by_title_lower
+        )
+
+    results = [
+        records.get(g["group_id"], empty_implication(g)) for g in target_groups
+    ]
+    llm_cache.put_cached(key, results, model=model_name)
+    return results
+
+
 # =============================================================================
 # MAIN EXTRACTION
 # =============================================================================
@@ -354,14 +561,16 @@ async def extract_implications_batch(
     llm_model: str | None = None,
     batch_size: int = 5,  # Not used anymore, kept for API compat
     max_concurrent: int = 3,
+    semaphore: AdaptiveSemaphore | None = None,
     progress_callback: Callable[[str], None] | None = None,
 ) -> list[dict]:
     """
-    Extract implications with concurrent LLM calls.
+    Extract implications with concurrent batched LLM calls.
 
-    Uses semaphore-based concurrency and processes results as they complete
-    (not waiting for batches). This prevents slow LLM responses from blocking
-    other requests.
+    Uncached groups are packed several per request (the shared
+    available-events context dominates token count, so batching
+    amortizes it) and dispatched concurrently. Per-request caching and
+    retries live in extract_implications_multi.
 
     Args:
         groups: Groups to process
@@ -370,6 +579,8 @@ async def extract_implications_batch(
         llm_model: Optional LLM model override
         batch_size: Deprecated, kept for API compatibility
         max_concurrent: Maximum concurrent LLM requests
+        semaphore: Optional shared adaptive semaphore (e.g. shared with
+                   the validation step so both respect one rate limit)
         progress_callback: Optional progress callback
 
     Returns:
@@ -389,120 +600,28 @@ async def extract_implications_batch(
         f"Processing {len(groups_to_process)} groups "
         f"({len(groups) - len(groups_to_process)} cached)"
     )
-
-    # Build context
-    group_titles_text = "\n".join(
-        f"{i}. {g['title']}" for i, g in enumerate(all_groups, 1)
+    if progress_callback:
+        progress_callback(f"Extracting implications for {len(groups_to_process)} groups")
+
+    # Lazy import: implications_parallel imports prompt helpers from
+    # this module at load time
+    from core.steps.implications_parallel import extract_implications_parallel
+
+    new_implications = await extract_implications_parallel(
+        groups_to_process,
+        max_concurrent=max_concurrent,
+        semaphore=semaphore,
+        all_groups=all_groups,
+        llm_model=llm_model,
     )
-    groups_by_title = {g["title"]: g for g in all_groups}
-    groups_by_title_lower = {g["title"].lower().strip(): g for g in all_groups}
-
-    # Get LLM client
-    llm = get_llm_client(llm_model)
-    model_name = llm_model or llm.model
-
-    semaphore = asyncio.Semaphore(max_concurrent)
-    completed_count = 0
-    total_count = len(groups_to_process)
 
-    async def process_group(target_group: dict, idx: int) -> dict:
-        nonlocal completed_count
-        async with semaphore:
-            prompt = IMPLICATION_PROMPT.format(
-                group_titles_text=group_titles_text,
-                target_title=target_group["title"],
-            )
-
-            result = None
-            max_retries = 3
-            timeout_seconds = 90  # Hard timeout per attempt
-
-            for attempt in range(max_retries):
-                try:
-                    response = await asyncio.wait_for(
-                        llm.complete(
-                            [{"role": "user", "content": prompt}],
-                            temperature=0.1,
-                        ),
-                        timeout=timeout_seconds,
-                    )
-
-                    llm_result = extract_json_from_response(str(response))
-
-                    if not llm_result:
-                        result = {
-                            "group_id": target_group["group_id"],
-                            "title": target_group["title"],
-                            "yes_covered_by": [],
-                            "no_covered_by": [],
-                        }
-                    else:
-                        result = derive_covers(
-                            llm_result,
-                            target_group,
-                            groups_by_title,
-                            groups_by_title_lower,
-                        )
-                    break  # Success, exit retry loop
-
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        f"Timeout (attempt {attempt + 1}/{max_retries}) for "
-                        f"{target_group['title'][:40]}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2**attempt)  # Exponential backoff
-                    continue
-
-                except Exception as e:
-                    logger.error(
-                        f"Error (attempt {attempt + 1}/{max_retries}) processing "
-                        f"{target_group['title'][:40]}: {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(1)
-                        continue
-                    break
-
-            # If all retries failed, return empty result
-            if result is None:
-                logger.error(f"All retries failed for {target_group['title'][:40]}")
-                result = {
-                    "group_id": target_group["group_id"],
-                    "title": target_group["title"],
-                    "yes_covered_by": [],
-                    "no_covered_by": [],
-                }
-
-            # Update progress after completion
-            completed_count += 1
-            if progress_callback:
-                progress_callback(f"Extracted {completed_count}/{total_count}")
-
-            return result
-
-    # Start all tasks at once - semaphore controls concurrency
-    tasks = [process_group(g, i) for i, g in enumerate(groups_to_process)]
-
-    # Process results as they complete (not waiting for batches)
-    all_new_implications = []
-    save_buffer = []
-    save_interval = 10  # Save to cache every N completions
-
-    for coro in asyncio.as_completed(tasks):
-        result = await coro
-        all_new_implications.append(result)
-        save_buffer.append(result)
-
-        # Save to cache periodically
-        if len(save_buffer) >= save_interval:
-            state.add_implications(save_buffer, model_name)
-            save_buffer = []
+    if new_implications:
+        llm = get_llm_client(llm_model)
+        state.add_implications(new_implications, llm_model or llm.model)
 
-    # Save any remaining results
-    if save_buffer:
-        state.add_implications(save_buffer, model_name)
+    if progress_callback:
+        progress_callback(f"Extracted {len(new_implications)} implications")
 
-    logger.info(f"Processed {len(all_new_implications)} new implications")
+    logger.info(f"Processed {len(new_implications)} new implications")
 
     return state.get_all_implications()
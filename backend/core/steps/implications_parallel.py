@@ -3,17 +3,21 @@ Parallel LLM processing for implications extraction.
 
 This module provides optimized parallel processing of market groups
 to significantly speed up the implications extraction pipeline.
+
+Groups are packed several-per-request (the shared available-events
+context dominates token count, so batching amortizes it), and chunks
+are dispatched concurrently under an adaptive semaphore.
 """
 
 import asyncio
-from typing import Any, List
+import os
+from typing import List
 
 from loguru import logger
 
-from core.steps.implications import (
-    extract_implications as extract_implications_single,
-    IMPLICATIONS_MODEL
-)
+from core.concurrency import AdaptiveSemaphore
+from core.models import get_llm_client
+from core.steps.implications import build_multi_prompt, extract_implications_multi
 
 # =============================================================================
 # CONFIGURATION
@@ -23,76 +27,45 @@ from core.steps.implications import (
 # Adjust based on your OpenRouter rate limits
 MAX_CONCURRENT_REQUESTS = 5
 
-# Batch size for processing groups
-BATCH_SIZE = 10
+# Target groups packed into a single LLM request
+GROUPS_PER_REQUEST = 4
+
+# Prompt batches built ahead of dispatch (double-buffering): prompt
+# construction for batch N+1 overlaps with network wait on batch N
+PREFETCH_DEPTH = 2
 
 # =============================================================================
 # PARALLEL PROCESSING
 # =============================================================================
 
 
-async def extract_implications_batch(
+async def extract_implications_parallel(
     groups: List[dict],
-    semaphore: asyncio.Semaphore
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    semaphore: AdaptiveSemaphore | None = None,
+    all_groups: List[dict] | None = None,
+    llm_model: str | None = None,
+    groups_per_request: int = GROUPS_PER_REQUEST,
 ) -> List[dict]:
     """
-    Extract implications for a batch of groups with concurrency control.
-    
-    Args:
-        groups: List of market groups to process
-        semaphore: Semaphore to limit concurrent requests
-    
-    Returns:
-        List of implications
-    """
-    async def process_group(group: dict) -> List[dict]:
-        """Process a single group with semaphore."""
-        async with semaphore:
-            try:
-                # Call the original single-group extraction
-                # Note: This assumes extract_implications can handle a single group
-                # You may need to adapt this based on the actual implementation
-                result = await asyncio.to_thread(
-                    extract_implications_single,
-                    [group]  # Pass as single-item list
-                )
-                return result if result else []
-            except Exception as e:
-                logger.error(f"Error processing group {group.get('id', 'unknown')}: {e}")
-                return []
-    
-    # Process all groups concurrently with semaphore limiting
-    tasks = [process_group(group) for group in groups]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # Flatten results and filter errors
-    implications = []
-    for result in results:
-        if isinstance(result, Exception):
-            logger.error(f"Task failed with exception: {result}")
-        elif isinstance(result, list):
-            implications.extend(result)
-    
-    return implications
+    Extract implications from market groups using parallel batched requests.
 
+    Splits groups into chunks of groups_per_request, builds one prompt per
+    chunk, and dispatches all chunks concurrently under the semaphore.
 
-async def extract_implications_parallel(
-    groups: List[dict],
-    max_concurrent: int = MAX_CONCURRENT_REQUESTS
-) -> List[dict]:
-    """
-    Extract implications from market groups using parallel processing.
-    
-    This function processes multiple groups concurrently to significantly
-    speed up the LLM inference pipeline.
-    
     Args:
         groups: List of market groups to analyze
         max_concurrent: Maximum number of concurrent LLM requests
-    
+        semaphore: Optional shared adaptive semaphore (e.g. shared with
+                   the validation step so both respect one rate limit)
+        all_groups: Full group list used as prompt context
+                    (defaults to groups)
+        llm_model: LLM model override (default: IMPLICATIONS_MODEL env)
+        groups_per_request: Target groups packed per LLM request
+
     Returns:
-        List of extracted implications
-    
+        List of extracted implications (one record per group)
+
     Example:
         >>> groups = load_groups()
         >>> implications = await extract_implications_parallel(groups)
@@ -101,45 +74,90 @@ async def extract_implications_parallel(
     if not groups:
         logger.warning("No groups provided for implications extraction")
         return []
-    
+
+    if semaphore is None:
+        semaphore = AdaptiveSemaphore(max_concurrent)
+
+    # Context shared by every chunk: all known events + title lookups
+    context_groups = all_groups if all_groups else groups
+    group_titles_text = "\n".join(
+        f"{i}. {g['title']}" for i, g in enumerate(context_groups, 1)
+    )
+    groups_by_title = {g["title"]: g for g in context_groups}
+    groups_by_title_lower = {g["title"].lower().strip(): g for g in context_groups}
+
+    model = llm_model or os.getenv("IMPLICATIONS_MODEL", "")
+    llm = get_llm_client(model)
+
+    chunks = [
+        groups[i : i + groups_per_request]
+        for i in range(0, len(groups), groups_per_request)
+    ]
+
     logger.info(
         f"Starting parallel implications extraction for {len(groups)} groups "
-        f"(max_concurrent={max_concurrent})"
+        f"({len(chunks)} requests of up to {groups_per_request}, "
+        f"max_concurrent={semaphore.limit})"
     )
-    
-    # Create semaphore to limit concurrency
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    # Process in batches to avoid memory issues with very large datasets
-    all_implications = []
-    
-    for i in range(0, len(groups), BATCH_SIZE):
-        batch = groups[i:i + BATCH_SIZE]
-        logger.info(f"Processing batch {i//BATCH_SIZE + 1} ({len(batch)} groups)")
-        
-        batch_implications = await extract_implications_batch(batch, semaphore)
-        all_implications.extend(batch_implications)
-        
-        logger.info(
-            f"Batch {i//BATCH_SIZE + 1} complete: "
-            f"{len(batch_implications)} implications extracted"
-        )
-    
+
+    # Producer/consumer prefetch pipeline: the producer builds prompts up
+    # to PREFETCH_DEPTH ahead while consumers wait on the network, so
+    # prompt construction never sits on the critical path.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PREFETCH_DEPTH)
+    num_workers = min(semaphore.limit, len(chunks))
+    results_by_index: dict[int, List[dict]] = {}
+
+    async def producer() -> None:
+        for idx, chunk in enumerate(chunks):
+            prompt = build_multi_prompt(chunk, group_titles_text)
+            await queue.put((idx, chunk, prompt))
+        for _ in range(num_workers):
+            await queue.put(None)  # One stop signal per worker
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            idx, chunk, prompt = item
+            try:
+                async with semaphore:
+                    result = await extract_implications_multi(
+                        chunk,
+                        group_titles_text,
+                        groups_by_title,
+                        groups_by_title_lower,
+                        llm,
+                        model,
+                        prompt=prompt,
+                    )
+                    semaphore.record_success()
+                results_by_index[idx] = result
+            except Exception as e:
+                logger.error(f"Chunk {idx} failed with exception: {e}")
+
+    await asyncio.gather(producer(), *[worker() for _ in range(num_workers)])
+
+    # Flatten results in original chunk order
+    implications: List[dict] = []
+    for idx in range(len(chunks)):
+        implications.extend(results_by_index.get(idx, []))
+
     logger.info(
-        f"Parallel extraction complete: {len(all_implications)} total implications "
+        f"Parallel extraction complete: {len(implications)} total implications "
         f"from {len(groups)} groups"
     )
-    
-    return all_implications
+
+    return implications
 
 
 def extract_implications_parallel_sync(
     groups: List[dict],
-    max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
 ) -> List[dict]:
     """
     Synchronous wrapper for parallel implications extraction.
-    
+
     Use this in synchronous contexts or when called from non-async code.
     """
     return asyncio.run(extract_implications_parallel(groups, max_concurrent))
@@ -152,23 +170,23 @@ def extract_implications_parallel_sync(
 
 async def extract_implications_with_timing(
     groups: List[dict],
-    max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
 ) -> tuple[List[dict], float]:
     """
     Extract implications with performance timing.
-    
+
     Returns:
         Tuple of (implications, elapsed_time_seconds)
     """
     import time
-    
+
     start_time = time.time()
     implications = await extract_implications_parallel(groups, max_concurrent)
     elapsed = time.time() - start_time
-    
+
     logger.info(
         f"Performance: Processed {len(groups)} groups in {elapsed:.2f}s "
         f"({len(groups)/elapsed:.2f} groups/s)"
     )
-    
+
     return implications, elapsed
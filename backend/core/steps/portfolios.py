@@ -29,6 +29,8 @@ Note:
     Portfolios should be recalculated when prices change.
 """
 
+from bisect import bisect_right
+
 from loguru import logger
 
 from core.state import PipelineState
@@ -92,6 +94,15 @@ def calculate_coverage_metrics(
     }
 
 
+# Precomputed ascending views of TIER_THRESHOLDS for O(log n) lookup:
+# bisect lands on the highest threshold the coverage clears, replacing
+# the per-portfolio linear scan over the tier table.
+_TIER_BOUNDS = sorted(t[0] for t in TIER_THRESHOLDS if t[0] > 0)
+_TIERS_ASC = [
+    (tier, label) for _, tier, label, _ in sorted(TIER_THRESHOLDS)
+]
+
+
 def classify_tier(coverage: float) -> tuple[int, str]:
     """
     Classify portfolio into tier based on coverage.
@@ -99,10 +110,7 @@ def classify_tier(coverage: float) -> tuple[int, str]:
     Returns:
         Tuple of (tier_number, tier_label)
     """
-    for threshold, tier, label, _ in TIER_THRESHOLDS:
-        if coverage >= threshold:
-            return tier, label
-    return 4, "LOW_COVERAGE"
+    return _TIERS_ASC[bisect_right(_TIER_BOUNDS, coverage)]
 
 
 # =============================================================================
@@ -368,19 +376,21 @@ def update_portfolio_prices(
 
             tier, tier_label = classify_tier(metrics["coverage"])
 
-            portfolio = {
-                **portfolio,
-                "target_price": new_target_price,
-                "cover_price": new_cover_price,
-                "total_cost": round(total_cost, 4),
-                "profit": round(1.0 - total_cost, 4),
-                "profit_pct": round((1.0 - total_cost) / total_cost * 100, 2)
+            # Mutate in place: the dicts are freshly deserialized from
+            # state, and a {**portfolio, ...} rebuild would copy ~30
+            # unchanged keys per portfolio on every price tick
+            portfolio["target_price"] = new_target_price
+            portfolio["cover_price"] = new_cover_price
+            portfolio["total_cost"] = round(total_cost, 4)
+            portfolio["profit"] = round(1.0 - total_cost, 4)
+            portfolio["profit_pct"] = (
+                round((1.0 - total_cost) / total_cost * 100, 2)
                 if total_cost > 0
-                else 0,
-                **metrics,
-                "tier": tier,
-                "tier_label": tier_label,
-            }
+                else 0
+            )
+            portfolio.update(metrics)
+            portfolio["tier"] = tier
+            portfolio["tier_label"] = tier_label
 
         updated.append(portfolio)
 
@@ -24,7 +24,9 @@ from typing import Callable
 
 from loguru import logger
 
-from core.models import get_llm_client
+from core import llm_cache
+from core.concurrency import AdaptiveSemaphore
+from core.models import call_with_feedback, get_llm_client
 from core.state import PipelineState
 from core.utils import extract_json_from_response
 
@@ -34,6 +36,12 @@ from core.utils import extract_json_from_response
 
 import os
 
+# LLM provider (part of the content-addressed cache key)
+LLM_PROVIDER = "openrouter"
+
+# Bump whenever VALIDATION_PROMPT changes (invalidates cached responses)
+PROMPT_VERSION = 1
+
 # Pairs per LLM call (balances efficiency with context limits)
 BATCH_SIZE = 32
 
@@ -174,6 +182,60 @@ BE STRICT. False positives cost money. When in doubt, set is_valid=false.
 """
 
 
+# =============================================================================
+# SIGNATURE CACHE (SLIDING WINDOW)
+# =============================================================================
+
+from collections import OrderedDict
+
+# Many candidate pairs share the same underlying implication structure:
+# the same YES/NO covering relationship between two groups, across sibling
+# markets with identical deadlines. One LLM verdict applies to all of them,
+# so we keep a small LRU of verdicts keyed by that structure + temporal
+# context and reuse it before issuing a new call.
+VALIDATION_CACHE_SIZE = 256
+
+_validation_signature_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+
+def implication_signature(pair: dict) -> tuple:
+    """
+    Canonical signature of the implication underlying a candidate pair.
+
+    Includes the temporal context (both resolution dates) so a verdict only
+    transfers between pairs with the same deadline structure.
+    """
+    return (
+        pair.get("target_group_id", ""),
+        pair.get("cover_group_id", ""),
+        pair.get("target_position", ""),
+        pair.get("cover_position", ""),
+        pair.get("relationship_type", ""),
+        pair.get("target_resolution"),
+        pair.get("cover_resolution"),
+    )
+
+
+def probe_signature_cache(pair: dict) -> dict | None:
+    """Return a cached verdict for this pair's signature, or None."""
+    sig = implication_signature(pair)
+    verdict = _validation_signature_cache.get(sig)
+    if verdict is None:
+        return None
+    _validation_signature_cache.move_to_end(sig)
+    # Re-key the shared verdict to this specific pair
+    return {**verdict, "pair_id": pair["pair_id"]}
+
+
+def record_signature_verdict(pair: dict, verdict: dict) -> None:
+    """Record an LLM verdict under the pair's signature (LRU evicting)."""
+    if "viability_score" not in verdict:
+        return  # Only cache decisive verdicts
+    _validation_signature_cache[implication_signature(pair)] = verdict
+    while len(_validation_signature_cache) > VALIDATION_CACHE_SIZE:
+        _validation_signature_cache.popitem(last=False)
+
+
 # =============================================================================
 # PRE-FILTERING
 # =============================================================================
@@ -427,26 +489,51 @@ HEDGE LOGIC: When target_{pair["target_position"]} loses, cover should pay out.
 # =============================================================================
 
 
+def is_validation_map(result: dict) -> bool:
+    """Check a cached result still matches the pair_id -> verdict shape."""
+    return isinstance(result, dict) and all(
+        isinstance(v, dict) and "viability_score" in v for v in result.values()
+    )
+
+
 async def validate_batch(
     pairs: list[dict],
     llm_model: str,
     batch_num: int,
 ) -> dict[str, dict]:
-    """Validate a batch of pairs via LLM."""
+    """Validate a batch of pairs via LLM (content-addressed cached)."""
     llm = get_llm_client(llm_model)
 
     pairs_text = "\n".join(format_pair_for_validation(p) for p in pairs)
     prompt = VALIDATION_PROMPT.format(pairs_text=pairs_text)
 
+    # Identical (model, prompt version, pairs) never hits the LLM twice
+    key = llm_cache.cache_key((LLM_PROVIDER, llm_model, PROMPT_VERSION, prompt))
+    cached = llm_cache.get_cached(key, validate=is_validation_map)
+    if cached is not None:
+        logger.debug(f"Batch {batch_num}: using cached validations")
+        return cached
+
+    def parse_validations(text: str) -> dict:
+        result = extract_json_from_response(text)
+        if not result or "validations" not in result:
+            raise ValueError(
+                "expected a JSON object with a 'validations' array of "
+                "per-pair verdicts"
+            )
+        return result
+
     try:
-        response = await llm.complete(
+        # On malformed output the parse error is fed back to the model
+        # for self-correction rather than rejecting the whole batch
+        result = await call_with_feedback(
+            llm,
             [{"role": "user", "content": prompt}],
+            parse_validations,
             temperature=0.1,
         )
 
-        result = extract_json_from_response(str(response))
-
-        if not result or "validations" not in result:
+        if result is None:
             logger.warning(f"Batch {batch_num}: Failed to parse LLM response")
             return {
                 p["pair_id"]: {
@@ -459,7 +546,9 @@ async def validate_batch(
                 for p in pairs
             }
 
-        return {v["pair_id"]: v for v in result.get("validations", [])}
+        validations = {v["pair_id"]: v for v in result.get("validations", [])}
+        llm_cache.put_cached(key, validations, model=llm_model)
+        return validations
 
     except Exception as e:
         logger.error(f"Batch {batch_num} error: {e}")
@@ -485,6 +574,7 @@ async def validate_pairs(
     min_viability: float = MIN_VIABILITY_SCORE,
     batch_size: int = BATCH_SIZE,
     progress_callback: Callable[[str], None] | None = None,
+    semaphore: AdaptiveSemaphore | None = None,
 ) -> tuple[list[dict], dict]:
     """
     Validate candidate pairs using LLM (with caching).
@@ -498,6 +588,8 @@ async def validate_pairs(
         min_viability: Minimum score to keep (default: 0.70)
         batch_size: Pairs per LLM call
         progress_callback: Optional progress callback
+        semaphore: Optional shared adaptive semaphore (e.g. shared with
+                   the implications step so both respect one rate limit)
 
     Returns:
         Tuple of (validated_pairs, summary_stats)
@@ -521,17 +613,54 @@ async def validate_pairs(
     if pairs_to_validate:
         pairs_to_validate, pre_filter_rejections = pre_filter_pairs(pairs_to_validate)
 
+    # Reuse verdicts for pairs whose implication signature was already judged
+    signature_hits: dict[str, dict] = {}
+    signature_hit_pairs: list[tuple[dict, dict]] = []
+    if pairs_to_validate:
+        remaining = []
+        for pair in pairs_to_validate:
+            verdict = probe_signature_cache(pair)
+            if verdict is not None:
+                signature_hits[pair["pair_id"]] = verdict
+                signature_hit_pairs.append((pair, verdict))
+            else:
+                remaining.append(pair)
+        pairs_to_validate = remaining
+
+    # Persist reused verdicts so future runs hit the SQLite cache directly
+    reused_valid = [
+        {
+            "pair_id": pair["pair_id"],
+            "target_group_id": pair["target_group_id"],
+            "target_market_id": pair["target_market_id"],
+            "target_position": pair["target_position"],
+            "cover_group_id": pair["cover_group_id"],
+            "cover_market_id": pair["cover_market_id"],
+            "cover_position": pair["cover_position"],
+            "cover_probability": pair.get("cover_probability", 0),
+            "viability_score": verdict.get("viability_score", 0),
+            "is_valid": True,
+            "validation_reason": verdict.get("brief_analysis", ""),
+        }
+        for pair, verdict in signature_hit_pairs
+        if verdict.get("is_valid", False)
+    ]
+    if reused_valid:
+        state.add_validated_pairs(reused_valid, model)
+
     pre_filtered_count = sum(pre_filter_rejections.values())
     logger.info(
         f"Validating {len(pairs_to_validate)} pairs "
-        f"({len(cached_validations)} cached, {pre_filtered_count} pre-filtered)"
+        f"({len(cached_validations)} cached, {len(signature_hits)} signature hits, "
+        f"{pre_filtered_count} pre-filtered)"
     )
 
     if not pairs_to_validate:
         # All from cache - filter and return
+        merged = {**cached_validations, **signature_hits}
         validated = []
         for pair in candidate_pairs:
-            cached = cached_validations.get(pair["pair_id"], {})
+            cached = merged.get(pair["pair_id"], {})
             # Check both viability_score AND is_valid (default True for backward compat)
             if cached.get("viability_score", 0) >= min_viability and cached.get(
                 "is_valid", True
@@ -541,6 +670,7 @@ async def validate_pairs(
         return validated, {
             "total_candidates": len(candidate_pairs),
             "from_cache": len(cached_validations),
+            "signature_hits": len(signature_hits),
             "pre_filtered": pre_filtered_count,
             "pre_filter_reasons": pre_filter_rejections,
             "validated_count": len(validated),
@@ -550,7 +680,7 @@ async def validate_pairs(
     # Validate new pairs in batches (parallel with semaphore-based rate limiting)
     import asyncio
 
-    all_validations = dict(cached_validations)
+    all_validations = {**cached_validations, **signature_hits}
     new_validated_pairs = []
     lock = asyncio.Lock()
 
@@ -563,7 +693,8 @@ async def validate_pairs(
 
     total_batches = len(batches)
     completed_batches = 0
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+    if semaphore is None:
+        semaphore = AdaptiveSemaphore(MAX_CONCURRENT_BATCHES)
 
     async def process_batch(batch: list[dict], batch_num: int) -> None:
         """Process a single batch with rate limiting."""
@@ -571,6 +702,7 @@ async def validate_pairs(
 
         async with semaphore:
             validations = await validate_batch(batch, model, batch_num)
+            semaphore.record_success()
 
             # Prepare valid pairs for caching
             pairs_to_cache = []
@@ -592,6 +724,9 @@ async def validate_pairs(
                     auto_rejected += 1
                     llm_valid = False
 
+                # Share this verdict with sibling pairs of the same implication
+                record_signature_verdict(pair, validation)
+
                 if llm_valid:
                     pairs_to_cache.append(
                         {
@@ -667,6 +802,7 @@ async def validate_pairs(
     summary = {
         "total_candidates": len(candidate_pairs),
         "from_cache": len(cached_validations),
+        "signature_hits": len(signature_hits),
         "pre_filtered": pre_filtered_count,
         "pre_filter_reasons": pre_filter_rejections,
         "new_validated": len(new_validated_pairs),
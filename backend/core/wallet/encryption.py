@@ -1,6 +1,7 @@
 """AES-256-GCM encryption for private keys."""
 
 import base64
+import hashlib
 import os
 
 from cryptography.exceptions import InvalidTag
@@ -8,16 +9,48 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 
+# Memoized derived keys so repeat unlocks of the same wallet skip the
+# 100k-iteration KDF. Keyed on a BLAKE2 digest of the password (never
+# the plaintext) plus the salt; bounded FIFO eviction.
+_key_cache: dict[tuple[bytes, bytes], bytes] = {}
+_KEY_CACHE_MAX = 32
+
 
 def _derive_key(password: str, salt: bytes) -> bytes:
-    """Derive 256-bit key from password using PBKDF2."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100_000,
+    """Derive 256-bit key from password using PBKDF2 (memoized)."""
+    cache_key = (
+        hashlib.blake2b(password.encode(), digest_size=32).digest(),
+        salt,
     )
-    return kdf.derive(password.encode())
+    key = _key_cache.get(cache_key)
+    if key is None:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=100_000,
+        )
+        key = kdf.derive(password.encode())
+        if len(_key_cache) >= _KEY_CACHE_MAX:
+            _key_cache.pop(next(iter(_key_cache)))
+        _key_cache[cache_key] = key
+    return key
+
+
+# AESGCM construction re-runs the AES key schedule in OpenSSL; reuse
+# the wrapper per derived key (same bound/eviction as the key cache)
+_aesgcm_cache: dict[bytes, AESGCM] = {}
+
+
+def _get_aesgcm(key: bytes) -> AESGCM:
+    """Get (or create) the AESGCM cipher for a derived key."""
+    aesgcm = _aesgcm_cache.get(key)
+    if aesgcm is None:
+        aesgcm = AESGCM(key)
+        if len(_aesgcm_cache) >= _KEY_CACHE_MAX:
+            _aesgcm_cache.pop(next(iter(_aesgcm_cache)))
+        _aesgcm_cache[key] = aesgcm
+    return aesgcm
 
 
 def encrypt_private_key(private_key: str, password: str) -> tuple[str, str]:
@@ -30,7 +63,7 @@ def encrypt_private_key(private_key: str, password: str) -> tuple[str, str]:
     salt = os.urandom(16)
     key = _derive_key(password, salt)
 
-    aesgcm = AESGCM(key)
+    aesgcm = _get_aesgcm(key)
     nonce = os.urandom(12)
 
     ciphertext = aesgcm.encrypt(nonce, private_key.encode(), None)
@@ -53,7 +86,7 @@ def decrypt_private_key(encrypted_b64: str, salt_b64: str, password: str) -> str
     nonce = encrypted[:12]
     ciphertext = encrypted[12:]
 
-    aesgcm = AESGCM(key)
+    aesgcm = _get_aesgcm(key)
     try:
         plaintext = aesgcm.decrypt(nonce, ciphertext, None)
         return plaintext.decode()
@@ -6,9 +6,9 @@ to an async queue for processing by the aggregation service.
 """
 
 import asyncio
-import json
-from datetime import datetime, timezone
+import time
 
+import orjson
 import websockets
 from loguru import logger
 
@@ -22,6 +22,83 @@ RECONNECT_BASE_SECONDS = 2
 RECONNECT_MAX_SECONDS = 60
 MAX_TOKENS_PER_CONNECTION = 500
 
+# Frames larger than this (initial book snapshots) are parsed in the
+# default thread pool so ping/price traffic keeps flowing; orjson
+# releases the GIL while parsing
+LARGE_FRAME_BYTES = 32768
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def extract_best_price(orders: list) -> float | None:
+    """Best price from an order-book side (list, dict, or bare entries)."""
+    if not orders:
+        return None
+    first = orders[0]
+    if isinstance(first, list):
+        return float(first[0]) if first else None
+    elif isinstance(first, dict):
+        return float(first.get("price", 0))
+    return float(first) if first else None
+
+
+# =============================================================================
+# RING QUEUE
+# =============================================================================
+
+
+class RingQueue:
+    """
+    Fixed-capacity single-producer/single-consumer event queue.
+
+    asyncio.Queue signals a Future per item; at hundreds of frames per
+    second that is a consumer wakeup per put. This buffer writes into a
+    preallocated list and sets one Event on the empty-to-nonempty
+    transition, so a burst of puts wakes the consumer once and drain()
+    hands back everything pending in a single batch.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_size", "_event")
+
+    def __init__(self, maxsize: int) -> None:
+        self._buf: list = [None] * maxsize
+        self._capacity = maxsize
+        self._head = 0  # Next slot to read
+        self._size = 0
+        self._event = asyncio.Event()
+
+    def put_nowait(self, item) -> None:
+        """Append an item; raises asyncio.QueueFull at capacity."""
+        if self._size == self._capacity:
+            raise asyncio.QueueFull
+        self._buf[(self._head + self._size) % self._capacity] = item
+        self._size += 1
+        if self._size == 1:
+            self._event.set()
+
+    def drain(self) -> list:
+        """Pop and return everything pending (clears the wakeup flag)."""
+        buf, cap, head, size = self._buf, self._capacity, self._head, self._size
+        if head + size <= cap:
+            items = buf[head : head + size]
+            buf[head : head + size] = [None] * size
+        else:
+            wrap = head + size - cap
+            items = buf[head:] + buf[:wrap]
+            buf[head:] = [None] * (cap - head)
+            buf[:wrap] = [None] * wrap
+        self._head = (head + size) % cap
+        self._size = 0
+        self._event.clear()
+        return items
+
+    async def wait(self) -> None:
+        """Block until at least one item is queued."""
+        await self._event.wait()
+
 
 # =============================================================================
 # CLOB WEBSOCKET CLIENT
@@ -39,7 +116,7 @@ class ClobWebSocketClient:
     - Event parsing and queue dispatch
     """
 
-    def __init__(self, price_queue: asyncio.Queue) -> None:
+    def __init__(self, price_queue: RingQueue) -> None:
         """
         Initialize the WebSocket client.
 
@@ -48,6 +125,8 @@ class ClobWebSocketClient:
         """
         self._price_queue = price_queue
         self._token_ids: list[str] = []
+        # Serialized once per token-list change, not per (re)connect
+        self._sub_payload: str = ""
         self._ws: websockets.WebSocketClientProtocol | None = None
         self._running = False
         self._connect_task: asyncio.Task | None = None
@@ -55,6 +134,15 @@ class ClobWebSocketClient:
         self._reconnect_attempts = 0
         self._resubscribe_event: asyncio.Event | None = None
 
+        # Per-event dispatch: one dict lookup instead of an if/elif
+        # ladder of string compares on every frame
+        self._dispatch = {
+            "price_change": self._handle_price_change,
+            "book": self._handle_book,
+            "last_trade_price": self._ignore_event,
+            "tick_size_change": self._log_tick_size_change,
+        }
+
     async def start(self, token_ids: list[str]) -> None:
         """
         Start the WebSocket connection.
@@ -66,6 +154,7 @@ class ClobWebSocketClient:
             return
 
         self._token_ids = token_ids[:MAX_TOKENS_PER_CONNECTION]
+        self._build_subscription_payload()
         if len(token_ids) > MAX_TOKENS_PER_CONNECTION:
             logger.warning(
                 f"Token count ({len(token_ids)}) exceeds limit "
@@ -107,6 +196,7 @@ class ClobWebSocketClient:
         Closes current connection and reconnects with new tokens.
         """
         self._token_ids = token_ids[:MAX_TOKENS_PER_CONNECTION]
+        self._build_subscription_payload()
         logger.info(f"Resubscribing to {len(self._token_ids)} tokens")
 
         # Wake up connect loop if it's waiting for tokens
@@ -120,6 +210,16 @@ class ClobWebSocketClient:
             except Exception:
                 pass
 
+    def _build_subscription_payload(self) -> None:
+        """Serialize the subscription message for the current tokens.
+
+        Decoded to str so the subscription still goes out as a text
+        frame, same as before.
+        """
+        self._sub_payload = orjson.dumps(
+            {"assets_ids": self._token_ids, "type": "market"}
+        ).decode()
+
     async def _connect_loop(self) -> None:
         """Main connection loop with auto-reconnection."""
         while self._running:
@@ -145,16 +245,18 @@ class ClobWebSocketClient:
                     CLOB_WS_URL,
                     ping_interval=None,  # We handle pings manually
                     ping_timeout=None,
+                    # Skip permessage-deflate: the zlib round-trip on
+                    # small JSON frames rivals the parse cost itself
+                    compression=None,
+                    max_size=2**20,
                 ) as ws:
                     self._ws = ws
                     self._reconnect_attempts = 0
 
-                    # Send subscription
-                    subscription = {
-                        "assets_ids": self._token_ids,
-                        "type": "market",
-                    }
-                    await ws.send(json.dumps(subscription))
+                    # Send prebuilt subscription (reconnect storms hit
+                    # this path repeatedly; serializing 500 token ids
+                    # each time is wasted work)
+                    await ws.send(self._sub_payload)
                     logger.info(
                         f"WebSocket connected, subscribed to {len(self._token_ids)} tokens"
                     )
@@ -208,7 +310,16 @@ class ClobWebSocketClient:
                 continue
 
             try:
-                data = json.loads(message)
+                # orjson parses str or bytes frames directly; at high
+                # tick rates the stdlib parser dominates this task's CPU.
+                # Oversized snapshots move off-loop so they don't stall
+                # the ping task or other frames mid-parse
+                if len(message) > LARGE_FRAME_BYTES:
+                    data = await asyncio.get_running_loop().run_in_executor(
+                        None, orjson.loads, message
+                    )
+                else:
+                    data = orjson.loads(message)
 
                 # Handle array of events (initial book snapshots)
                 if isinstance(data, list):
@@ -217,31 +328,29 @@ class ClobWebSocketClient:
                 else:
                     await self._process_event(data)
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning(f"Invalid JSON message: {message[:100]}")
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
 
     async def _process_event(self, data: dict) -> None:
         """Dispatch event to specific handler based on event_type."""
-        event_type = data.get("event_type")
-
-        if event_type == "price_change":
-            await self._handle_price_change(data)
-        elif event_type == "book":
-            # Initial book snapshot - extract prices
-            await self._handle_book(data)
-        elif event_type == "last_trade_price":
-            # Trade events - skip per user preference
-            pass
-        elif event_type == "tick_size_change":
-            logger.debug(f"Tick size change: {data}")
-        else:
-            logger.debug(f"Unknown event type: {event_type}")
+        handler = self._dispatch.get(data.get("event_type"), self._log_unknown_event)
+        await handler(data)
+
+    async def _ignore_event(self, data: dict) -> None:
+        """Drop the event (trade events - skip per user preference)."""
+
+    async def _log_tick_size_change(self, data: dict) -> None:
+        logger.debug(f"Tick size change: {data}")
+
+    async def _log_unknown_event(self, data: dict) -> None:
+        logger.debug(f"Unknown event type: {data.get('event_type')}")
 
     async def _handle_price_change(self, data: dict) -> None:
         """
-        Handle price_change events and push to queue.
+        Handle price_change events and push them to the queue as one
+        batched item per frame.
 
         Event format:
         {
@@ -252,8 +361,14 @@ class ClobWebSocketClient:
             ]
         }
         """
-        receive_time = datetime.now(timezone.utc)
-
+        # Raw nanoseconds, not a datetime: constructing a tz-aware
+        # datetime per frame is far heavier, and consumers convert at
+        # the edge only if they ever serialize it
+        receive_time_ns = time.time_ns()
+
+        # One queue item per frame, not per token: a single frame can
+        # carry many changes, and each put_nowait wakes the consumer
+        events = []
         for change in data.get("price_changes", []):
             token_id = change.get("asset_id")
             if not token_id:
@@ -265,20 +380,29 @@ class ClobWebSocketClient:
             if not best_bid and not best_ask:
                 continue
 
-            try:
-                self._price_queue.put_nowait(
-                    {
-                        "type": "price_change",
-                        "token_id": token_id,
-                        "bid": float(best_bid) if best_bid else None,
-                        "ask": float(best_ask) if best_ask else None,
-                        "timestamp": receive_time,
-                    }
-                )
-            except asyncio.QueueFull:
-                logger.warning(
-                    f"Price queue full, dropping price_change for {token_id}"
-                )
+            events.append(
+                {
+                    "token_id": token_id,
+                    "bid": float(best_bid) if best_bid else None,
+                    "ask": float(best_ask) if best_ask else None,
+                }
+            )
+
+        if not events:
+            return
+
+        try:
+            self._price_queue.put_nowait(
+                {
+                    "type": "price_change_batch",
+                    "events": events,
+                    "timestamp_ns": receive_time_ns,
+                }
+            )
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Price queue full, dropping {len(events)} price changes"
+            )
 
     async def _handle_book(self, data: dict) -> None:
         """
@@ -292,26 +416,15 @@ class ClobWebSocketClient:
             "asks": [[price, size], ...]
         }
         """
-        receive_time = datetime.now(timezone.utc)
+        receive_time_ns = time.time_ns()
         token_id = data.get("asset_id")
         if not token_id:
             return
 
-        bids = data.get("bids", [])
-        asks = data.get("asks", [])
-
-        def extract_best_price(orders: list) -> float | None:
-            if not orders:
-                return None
-            first = orders[0]
-            if isinstance(first, list):
-                return float(first[0]) if first else None
-            elif isinstance(first, dict):
-                return float(first.get("price", 0))
-            return float(first) if first else None
-
-        best_bid = extract_best_price(bids)
-        best_ask = extract_best_price(asks)
+        # Module-level helper: defining it here rebuilt the function
+        # object on every snapshot
+        best_bid = extract_best_price(data.get("bids", []))
+        best_ask = extract_best_price(data.get("asks", []))
 
         if best_bid is not None or best_ask is not None:
             try:
@@ -321,7 +434,7 @@ class ClobWebSocketClient:
                         "token_id": token_id,
                         "bid": best_bid,
                         "ask": best_ask,
-                        "timestamp": receive_time,
+                        "timestamp_ns": receive_time_ns,
                     }
                 )
             except asyncio.QueueFull:
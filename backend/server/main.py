@@ -1,5 +1,7 @@
 """FastAPI application for Alphapoly."""
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -19,6 +21,13 @@ from core.market_poller import market_poller
 async def lifespan(app: FastAPI):
     """Manage application lifecycle - start/stop background services."""
     # Startup
+    if sys.version_info >= (3, 12):
+        # Run new coroutines synchronously until their first suspension,
+        # skipping a scheduling round-trip for tasks that complete or
+        # suspend on already-ready awaitables. The factory is loop-global,
+        # so every create_task in the server benefits.
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logger.info("Starting Alphapoly API...")
     await price_aggregation.start()
     await market_poller.start()
@@ -5,10 +5,14 @@ Manages portfolio state and calculates price-induced changes.
 Used by the portfolio WebSocket to push updates to clients.
 """
 
-import json
+import time
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
+from math import floor
 
+import orjson
 from loguru import logger
 
 from core.paths import LIVE_DIR, TIER_THRESHOLDS
@@ -17,6 +21,24 @@ from core.paths import LIVE_DIR, TIER_THRESHOLDS
 # CONFIGURATION
 # =============================================================================
 RELOAD_INTERVAL_SECONDS = 60  # Reload portfolios.json periodically
+STAT_DEBOUNCE_SECONDS = 1.0  # Min gap between stat() checks in should_reload
+
+
+def _round4(x: float) -> float:
+    """round(x, 4) via scaled floor.
+
+    float.__round__ with ndigits runs a correctly-rounded decimal
+    conversion that dominates the per-row recalculation cost at seven
+    calls per updated portfolio. Rounds half-up instead of half-even;
+    indistinguishable for price-derived values.
+    """
+    return floor(x * 10000.0 + 0.5) / 10000.0
+
+
+# TIER_THRESHOLDS is ordered highest-first for readability; bisect
+# wants ascending keys, so precompute the sorted view once at import
+_TIERS_ASC = sorted(TIER_THRESHOLDS)
+_TIER_KEYS = [t[0] for t in _TIERS_ASC]
 
 
 # =============================================================================
@@ -24,7 +46,7 @@ RELOAD_INTERVAL_SECONDS = 60  # Reload portfolios.json periodically
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioDelta:
     """Changes to portfolios from a price update."""
 
@@ -57,9 +79,18 @@ class PortfolioService:
 
     def __init__(self):
         self._portfolios: list[dict] = []
-        self._market_to_portfolios: dict[str, list[int]] = {}
+        # Sorted display view: (tier, -coverage, idx) tuples. The
+        # portfolio list itself stays in load order so the market
+        # index keeps pointing at the right rows
+        self._order_keys: list[tuple] = []
+        self._market_to_portfolios: dict[str, tuple[int, ...]] = {}
+        # Incremental summary counters so get_summary is O(1) instead
+        # of a full walk per call
+        self._by_tier: dict[int, int] = {}
+        self._profitable_count = 0
         self._last_load: datetime | None = None
         self._file_mtime: float | None = None  # Track file modification time
+        self._last_stat_check = 0.0  # monotonic time of last stat()
         self._loaded = False
 
     def load_portfolios(self) -> None:
@@ -69,7 +100,10 @@ class PortfolioService:
         if not portfolios_path.exists():
             logger.warning("portfolios.json not found, clearing cache")
             self._portfolios = []
+            self._order_keys = []
             self._market_to_portfolios = {}
+            self._by_tier = {}
+            self._profitable_count = 0
             self._file_mtime = None
             self._loaded = True  # Mark as loaded (with empty data)
             self._last_load = datetime.now(timezone.utc)
@@ -79,7 +113,10 @@ class PortfolioService:
             # Track file modification time
             self._file_mtime = portfolios_path.stat().st_mtime
 
-            data = json.loads(portfolios_path.read_text())
+            # orjson on the raw bytes skips the intermediate str decode
+            # and the stdlib parser — this runs on the serving process
+            # every time the file changes (or every 60s)
+            data = orjson.loads(portfolios_path.read_bytes())
 
             if isinstance(data, dict) and "portfolios" in data:
                 portfolios = data["portfolios"]
@@ -90,6 +127,8 @@ class PortfolioService:
 
             self._portfolios = portfolios
             self._build_market_index()
+            self._rebuild_sort_order()
+            self._init_summary_counters()
             self._last_load = datetime.now(timezone.utc)
             self._loaded = True
 
@@ -98,26 +137,63 @@ class PortfolioService:
                 f"tracking {len(self._market_to_portfolios)} markets"
             )
 
-        except (json.JSONDecodeError, OSError) as e:
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.error(f"Error loading portfolios: {e}")
 
     def _build_market_index(self) -> None:
         """Build mapping from market_id to portfolio indices."""
-        self._market_to_portfolios = {}
+        index: dict[str, list[int]] = {}
 
         for idx, portfolio in enumerate(self._portfolios):
             target_id = portfolio.get("target_market_id")
             cover_id = portfolio.get("cover_market_id")
 
+            # setdefault: one hash lookup per market instead of a
+            # membership test plus a second lookup
             if target_id:
-                if target_id not in self._market_to_portfolios:
-                    self._market_to_portfolios[target_id] = []
-                self._market_to_portfolios[target_id].append(idx)
+                index.setdefault(target_id, []).append(idx)
 
             if cover_id:
-                if cover_id not in self._market_to_portfolios:
-                    self._market_to_portfolios[cover_id] = []
-                self._market_to_portfolios[cover_id].append(idx)
+                index.setdefault(cover_id, []).append(idx)
+
+        # Freeze to tuples: the index is read-only until the next
+        # reload, and tuples are smaller and cache-friendlier
+        self._market_to_portfolios = {k: tuple(v) for k, v in index.items()}
+
+    def _rebuild_sort_order(self) -> None:
+        """Rebuild the sorted display view from scratch (on reload)."""
+        self._order_keys = sorted(
+            (p.get("tier", 4), -p.get("coverage", 0.0), idx)
+            for idx, p in enumerate(self._portfolios)
+        )
+
+    def _reposition(self, old_key: tuple, new_key: tuple) -> None:
+        """Move one row to its new slot in the sorted view.
+
+        O(log N) search plus a C-level list shift, versus the full
+        re-sort with a Python key function this replaces.
+        """
+        pos = bisect_left(self._order_keys, old_key)
+        if pos < len(self._order_keys) and self._order_keys[pos] == old_key:
+            del self._order_keys[pos]
+        insort(self._order_keys, new_key)
+
+    def _init_summary_counters(self) -> None:
+        """Seed the summary counters with one full pass (on reload)."""
+        by_tier: dict[int, int] = {}
+        profitable = 0
+        for p in self._portfolios:
+            tier = p.get("tier", 4)
+            by_tier[tier] = by_tier.get(tier, 0) + 1
+            if p.get("expected_profit", 0) > 0.001:
+                profitable += 1
+        self._by_tier = by_tier
+        self._profitable_count = profitable
+
+    def _sorted_portfolios(self) -> list[dict]:
+        """Portfolios in display order (tier asc, coverage desc)."""
+        portfolios = self._portfolios
+        return [portfolios[key[2]] for key in self._order_keys]
 
     def should_reload(self) -> bool:
         """Check if portfolios should be reloaded from disk."""
@@ -126,6 +202,13 @@ class PortfolioService:
         if self._last_load is None:
             return True
 
+        # Debounce: update_prices consults this at tick rate, and the
+        # stat() answer only changes every few seconds at most
+        now = time.monotonic()
+        if now - self._last_stat_check < STAT_DEBOUNCE_SECONDS:
+            return False
+        self._last_stat_check = now
+
         portfolios_path = LIVE_DIR / "portfolios.json"
 
         # Check if file was deleted (and we have cached data)
@@ -172,35 +255,37 @@ class PortfolioService:
                 )
                 return PortfolioDelta(
                     full_reload=True,
-                    all_portfolios=self._portfolios.copy(),
+                    all_portfolios=self._sorted_portfolios(),
                 )
 
         if not self._portfolios:
             return PortfolioDelta()
 
         delta = PortfolioDelta()
-        affected_indices: set[int] = set()
 
-        # Find portfolios affected by price changes
-        for market_id in market_prices.keys():
-            if market_id in self._market_to_portfolios:
-                affected_indices.update(self._market_to_portfolios[market_id])
+        # Find portfolios affected by price changes: intersect the key
+        # sets at C level, then union the index tuples — no per-market
+        # Python-level membership loop
+        index = self._market_to_portfolios
+        hot = market_prices.keys() & index.keys()
+        affected_indices = set().union(*(index[m] for m in hot))
+
+        # Recalculate affected portfolios. Lookups are hoisted to locals:
+        # this loop runs per batch at tick rate, and the attribute/method
+        # loads are pure interpreter overhead repeated per portfolio
+        portfolios = self._portfolios
+        recalculate = self._recalculate_portfolio
+        changed_append = delta.changed.append
+        tier_changes_append = delta.tier_changes.append
 
-        # Recalculate affected portfolios
         for idx in affected_indices:
-            portfolio = self._portfolios[idx]
-            updated, tier_change = self._recalculate_portfolio(portfolio, market_prices)
+            updated, tier_change = recalculate(idx, portfolios[idx], market_prices)
 
             if updated:
-                delta.changed.append(updated)
-                self._portfolios[idx] = updated
+                changed_append(updated)
 
                 if tier_change:
-                    delta.tier_changes.append(tier_change)
-
-        # Re-sort if there were tier changes
-        if delta.tier_changes:
-            self._portfolios.sort(key=lambda p: (p["tier"], -p["coverage"]))
+                    tier_changes_append(tier_change)
 
         if delta.changed:
             logger.debug(
@@ -212,12 +297,16 @@ class PortfolioService:
 
     def _recalculate_portfolio(
         self,
+        idx: int,
         portfolio: dict,
         market_prices: dict[str, dict],
     ) -> tuple[dict | None, dict | None]:
         """
         Recalculate a single portfolio with new prices.
 
+        Mutates the portfolio dict in place and keeps the sorted view
+        and summary counters consistent as part of the same step.
+
         Returns:
             Tuple of (updated_portfolio, tier_change_info) or (None, None) if no change
         """
@@ -229,8 +318,6 @@ class PortfolioService:
         # Get current prices
         old_target_price = portfolio.get("target_price", 0.5)
         old_cover_price = portfolio.get("cover_price", 0.5)
-        cover_probability = portfolio.get("cover_probability", 0.9)
-        old_tier = portfolio.get("tier", 4)
 
         # Get new prices
         target_data = market_prices.get(target_id, {})
@@ -259,6 +346,11 @@ class PortfolioService:
         if not price_changed:
             return None, None
 
+        # Only read past this point: in the common case a sibling token
+        # in the batch triggered the call and we exit above
+        cover_probability = portfolio.get("cover_probability", 0.9)
+        old_tier = portfolio.get("tier", 4)
+
         # Recalculate metrics
         total_cost = new_target_price + new_cover_price
         p_target = new_target_price
@@ -267,31 +359,54 @@ class PortfolioService:
         expected_profit = coverage - total_cost
         loss_probability = p_not_target * (1 - cover_probability)
 
-        # Classify tier
-        new_tier = 4
-        new_tier_label = "LOW_COVERAGE"
-        for threshold, tier, label in TIER_THRESHOLDS:
-            if coverage >= threshold:
-                new_tier = tier
-                new_tier_label = label
-                break
-
-        # Build updated portfolio
-        updated = {
-            **portfolio,
-            "target_price": round(new_target_price, 4),
-            "cover_price": round(new_cover_price, 4),
-            "total_cost": round(total_cost, 4),
-            "profit": round(1.0 - total_cost, 4),
-            "profit_pct": (
-                round((1.0 - total_cost) / total_cost * 100, 2) if total_cost > 0 else 0
-            ),
-            "coverage": round(coverage, 4),
-            "loss_probability": round(loss_probability, 4),
-            "expected_profit": round(expected_profit, 4),
-            "tier": new_tier,
-            "tier_label": new_tier_label,
-        }
+        # Classify tier: highest threshold <= coverage, via C-level
+        # bisect instead of a linear scan per update
+        i = bisect_right(_TIER_KEYS, coverage) - 1
+        if i >= 0:
+            _, new_tier, new_tier_label = _TIERS_ASC[i]
+        else:
+            new_tier, new_tier_label = 4, "LOW_COVERAGE"
+
+        # Old values needed for view/counter maintenance below
+        old_coverage = portfolio.get("coverage", 0.0)
+        was_profitable = portfolio.get("expected_profit", 0) > 0.001
+
+        new_coverage = _round4(coverage)
+        new_expected_profit = _round4(expected_profit)
+
+        # Update in place: rebuilding the ~20-key dict copied every
+        # metadata field per tick. update_prices hands the same
+        # reference to the delta, so mutation is safe
+        portfolio["target_price"] = _round4(new_target_price)
+        portfolio["cover_price"] = _round4(new_cover_price)
+        portfolio["total_cost"] = _round4(total_cost)
+        portfolio["profit"] = _round4(1.0 - total_cost)
+        portfolio["profit_pct"] = (
+            floor((1.0 - total_cost) / total_cost * 100 * 100.0 + 0.5) / 100.0
+            if total_cost > 0
+            else 0
+        )
+        portfolio["coverage"] = new_coverage
+        portfolio["loss_probability"] = _round4(loss_probability)
+        portfolio["expected_profit"] = new_expected_profit
+        portfolio["tier"] = new_tier
+        portfolio["tier_label"] = new_tier_label
+
+        # Keep the display view sorted incrementally; the portfolio
+        # list itself never reorders, so the market index stays valid
+        if new_tier != old_tier or new_coverage != old_coverage:
+            self._reposition(
+                (old_tier, -old_coverage, idx), (new_tier, -new_coverage, idx)
+            )
+
+        # Maintain summary counters in the same step
+        if new_tier != old_tier:
+            self._by_tier[old_tier] = self._by_tier.get(old_tier, 1) - 1
+            self._by_tier[new_tier] = self._by_tier.get(new_tier, 0) + 1
+
+        is_profitable = new_expected_profit > 0.001
+        if is_profitable != was_profitable:
+            self._profitable_count += 1 if is_profitable else -1
 
         # Check for tier change
         tier_change = None
@@ -300,10 +415,10 @@ class PortfolioService:
                 "pair_id": portfolio.get("pair_id"),
                 "old_tier": old_tier,
                 "new_tier": new_tier,
-                "coverage": round(coverage, 4),
+                "coverage": new_coverage,
             }
 
-        return updated, tier_change
+        return portfolio, tier_change
 
     def get_portfolios(
         self,
@@ -327,23 +442,18 @@ class PortfolioService:
         if self.should_reload():
             self.load_portfolios()
 
-        filtered = self._portfolios
+        # Single lazy pass over the sorted view: only the requested
+        # page is materialized, not full intermediate filtered lists
+        portfolios = self._portfolios
+        rows = (portfolios[key[2]] for key in self._order_keys)
 
-        # Apply tier filter
         if max_tier < 4:
-            filtered = [p for p in filtered if p.get("tier", 4) <= max_tier]
+            rows = (p for p in rows if p.get("tier", 4) <= max_tier)
 
-        # Apply profitable filter
         if profitable_only:
-            filtered = [p for p in filtered if p.get("expected_profit", 0) > 0.001]
-
-        # Apply pagination
-        if offset:
-            filtered = filtered[offset:]
-        if limit:
-            filtered = filtered[:limit]
+            rows = (p for p in rows if p.get("expected_profit", 0) > 0.001)
 
-        return filtered
+        return list(islice(rows, offset, offset + limit if limit else None))
 
     def get_summary(self) -> dict:
         """Get summary statistics about portfolios."""
@@ -357,21 +467,16 @@ class PortfolioService:
                 "profitable_count": 0,
             }
 
-        by_tier = {}
-        profitable_count = 0
-
-        for p in self._portfolios:
-            tier = p.get("tier", 4)
-            tier_key = f"tier_{tier}"
-            by_tier[tier_key] = by_tier.get(tier_key, 0) + 1
-
-            if p.get("expected_profit", 0) > 0.001:
-                profitable_count += 1
-
+        # Served from the incrementally maintained counters — O(1)
+        # regardless of portfolio count
         return {
             "total": len(self._portfolios),
-            "by_tier": by_tier,
-            "profitable_count": profitable_count,
+            "by_tier": {
+                f"tier_{tier}": count
+                for tier, count in sorted(self._by_tier.items())
+                if count
+            },
+            "profitable_count": self._profitable_count,
             "market_count": len(self._market_to_portfolios),
         }
 
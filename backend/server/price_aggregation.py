@@ -12,7 +12,7 @@ from typing import Any
 
 from loguru import logger
 
-from server.clob_websocket import ClobWebSocketClient
+from server.clob_websocket import ClobWebSocketClient, RingQueue
 from server.token_resolver import token_resolver
 
 # =============================================================================
@@ -71,7 +71,7 @@ class PriceAggregationService:
 
     def __init__(self) -> None:
         # Price caches
-        self._token_prices: dict[str, dict] = {}  # token_id → {bid, ask, timestamp}
+        self._token_prices: dict[str, dict] = {}  # token_id → {bid, ask, timestamp_ns}
         self._market_prices: dict[
             str, dict
         ] = {}  # market_id → {yes, no, event_id, question}
@@ -81,7 +81,7 @@ class PriceAggregationService:
         self._running = False
 
         # Components
-        self._price_queue: asyncio.Queue = asyncio.Queue(maxsize=PRICE_QUEUE_MAX_SIZE)
+        self._price_queue = RingQueue(PRICE_QUEUE_MAX_SIZE)
         self._ws_client: ClobWebSocketClient | None = None
 
         # Tasks
@@ -245,13 +245,15 @@ class PriceAggregationService:
         """Consume price events from queue and update caches."""
         while self._running:
             try:
-                # Wait for event with timeout to allow checking _running flag
+                # Wait for events with timeout to allow checking _running flag
                 try:
-                    event = await asyncio.wait_for(self._price_queue.get(), timeout=1.0)
+                    await asyncio.wait_for(self._price_queue.wait(), timeout=1.0)
                 except asyncio.TimeoutError:
                     continue
 
-                await self._process_price_event(event)
+                # One wakeup per burst: drain everything pending
+                for event in self._price_queue.drain():
+                    await self._process_price_event(event)
 
             except asyncio.CancelledError:
                 break
@@ -259,31 +261,67 @@ class PriceAggregationService:
                 logger.error(f"Error in price event loop: {e}")
 
     async def _process_price_event(self, event: dict) -> None:
-        """Process a single price event and update caches."""
-        token_id = event.get("token_id")
-        if not token_id:
-            return
+        """Process one queue item (a single event or a batched frame)."""
+        if event.get("type") == "price_change_batch":
+            # One item per WebSocket frame; apply every token change,
+            # then take the callback lock once for the whole batch
+            timestamp_ns = event.get("timestamp_ns")
+            changed = [
+                market_id
+                for change in event["events"]
+                if (
+                    market_id := self._apply_token_price(
+                        change["token_id"], change["bid"], change["ask"], timestamp_ns
+                    )
+                )
+                is not None
+            ]
+            if not changed:
+                return
+
+            async with self._callback_lock:
+                self._changed_markets.update(changed)
+        else:
+            token_id = event.get("token_id")
+            if not token_id:
+                return
+
+            market_id = self._apply_token_price(
+                token_id, event.get("bid"), event.get("ask"), event.get("timestamp_ns")
+            )
+            if market_id is None:
+                return
+
+            # Track for callback batching
+            async with self._callback_lock:
+                self._changed_markets.add(market_id)
+
+        self._last_update = datetime.now(timezone.utc)
 
-        # Update token-level cache
+    def _apply_token_price(
+        self, token_id: str, bid: float | None, ask: float | None, timestamp_ns: int | None
+    ) -> str | None:
+        """Update the token cache and re-aggregate its market.
+
+        Returns the market_id, or None if the token is unknown.
+
+        Receive times are kept as raw time.time_ns() values; convert
+        with datetime.fromtimestamp(ns / 1e9, tz=timezone.utc) if one
+        ever needs to be serialized.
+        """
         self._token_prices[token_id] = {
-            "bid": event.get("bid"),
-            "ask": event.get("ask"),
-            "timestamp": event.get("timestamp"),
+            "bid": bid,
+            "ask": ask,
+            "timestamp_ns": timestamp_ns,
         }
 
-        # Get token metadata
         meta = token_resolver.get_token_metadata(token_id)
         if not meta:
-            return
+            return None
 
         market_id = meta["market_id"]
         self._aggregate_market_price(market_id)
-
-        # Track for callback batching
-        async with self._callback_lock:
-            self._changed_markets.add(market_id)
-
-        self._last_update = datetime.now(timezone.utc)
+        return market_id
 
     def _aggregate_market_price(self, market_id: str) -> None:
         """Aggregate token prices into market YES/NO prices."""
@@ -20,6 +20,11 @@ from server.price_aggregation import PriceAggregationService
 MAX_TOKENS_PER_CONNECTION = 500  # Polymarket limit
 MAX_WEBSOCKET_CONNECTIONS = 10   # Safety limit
 
+# Fallback refresh interval when no file-change event arrives (seconds).
+# The token set only changes when the pipeline writes portfolios.json,
+# so this is a safety net, not the primary trigger.
+REFRESH_FALLBACK_SECONDS = 60
+
 
 # =============================================================================
 # MULTI-CONNECTION PRICE AGGREGATION
@@ -37,6 +42,9 @@ class MultiConnectionPriceAggregation(PriceAggregationService):
     def __init__(self) -> None:
         super().__init__()
         self._ws_clients: List[ClobWebSocketClient] = []
+        self._tokens_changed = asyncio.Event()
+        self._token_key: int | None = None
+        self._watch_task: asyncio.Task | None = None
     
     async def start(self) -> None:
         """Start the price aggregation service with multiple WebSocket connections."""
@@ -50,8 +58,9 @@ class MultiConnectionPriceAggregation(PriceAggregationService):
         # Start event processing loop
         self._event_loop_task = asyncio.create_task(self._event_loop())
         
-        # Start subscription refresh loop
+        # Start subscription refresh loop and the file watcher that wakes it
         self._refresh_task = asyncio.create_task(self._refresh_subscriptions())
+        self._watch_task = asyncio.create_task(self._watch_portfolios())
         
         # Start callback batching loop
         self._callback_task = asyncio.create_task(self._callback_loop())
@@ -63,17 +72,23 @@ class MultiConnectionPriceAggregation(PriceAggregationService):
         logger.info("Stopping Multi-Connection PriceAggregationService...")
         self._running = False
         
-        # Stop all WebSocket clients
-        for client in self._ws_clients:
-            try:
-                await client.stop()
-            except Exception as e:
-                logger.error(f"Error stopping WebSocket client: {e}")
-        
+        # Stop all WebSocket clients concurrently
+        results = await asyncio.gather(
+            *(client.stop() for client in self._ws_clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping WebSocket client: {result}")
+
         self._ws_clients.clear()
         
         # Stop tasks
-        for task in [self._event_loop_task, self._refresh_task, self._callback_task]:
+        for task in [
+            self._event_loop_task,
+            self._refresh_task,
+            self._callback_task,
+            self._watch_task,
+        ]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -83,30 +98,54 @@ class MultiConnectionPriceAggregation(PriceAggregationService):
         
         logger.info("Multi-Connection PriceAggregationService stopped")
     
+    async def _watch_portfolios(self) -> None:
+        """Watch LIVE_DIR and wake the refresh loop when portfolios.json changes."""
+        from watchfiles import awatch
+        from core.paths import LIVE_DIR
+
+        LIVE_DIR.mkdir(parents=True, exist_ok=True)
+        async for changes in awatch(LIVE_DIR):
+            if any(path.endswith("portfolios.json") for _, path in changes):
+                self._tokens_changed.set()
+
     async def _refresh_subscriptions(self) -> None:
         """
-        Periodically refresh WebSocket subscriptions.
-        
-        Creates multiple connections if needed to handle all tokens.
+        Refresh WebSocket subscriptions when the token set changes.
+
+        Woken by the portfolios.json file watcher; also runs on a slow
+        timer as a safety net. Creates multiple connections if needed
+        to handle all tokens.
         """
         from server.token_resolver import token_resolver
         from core.paths import LIVE_DIR
-        
+
         while self._running:
             try:
                 # Get all token IDs from portfolios
                 portfolios_file = LIVE_DIR / "portfolios.json"
                 if portfolios_file.exists():
                     token_ids = await token_resolver.get_all_tokens()
-                    
+
                     if token_ids:
-                        await self._update_multi_connections(token_ids)
-                
+                        # Skip the resubscribe round-trip when the token
+                        # set is unchanged since the last refresh
+                        token_key = hash(tuple(sorted(token_ids)))
+                        if token_key != self._token_key:
+                            await self._update_multi_connections(token_ids)
+                            self._token_key = token_key
+
             except Exception as e:
                 logger.error(f"Error refreshing subscriptions: {e}")
-            
-            # Wait before next refresh
-            await asyncio.sleep(5)  # SUBSCRIPTION_REFRESH_INTERVAL
+
+            # Sleep until the watcher signals a change (or the fallback
+            # interval elapses) instead of polling every few seconds
+            try:
+                await asyncio.wait_for(
+                    self._tokens_changed.wait(), timeout=REFRESH_FALLBACK_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._tokens_changed.clear()
     
     async def _update_multi_connections(self, token_ids: List[str]) -> None:
         """
@@ -126,40 +165,49 @@ class MultiConnectionPriceAggregation(PriceAggregationService):
             num_connections_needed = MAX_WEBSOCKET_CONNECTIONS
             token_ids = token_ids[:MAX_WEBSOCKET_CONNECTIONS * MAX_TOKENS_PER_CONNECTION]
         
+        batches = [
+            token_ids[i * MAX_TOKENS_PER_CONNECTION : (i + 1) * MAX_TOKENS_PER_CONNECTION]
+            for i in range(num_connections_needed)
+        ]
+
         # Stop existing clients if connection count changed
         if len(self._ws_clients) != num_connections_needed:
             logger.info(
                 f"Updating WebSocket connections: {len(self._ws_clients)} → {num_connections_needed}"
             )
-            
-            for client in self._ws_clients:
-                await client.stop()
-            
+
+            # The connections are independent; awaiting them one by one
+            # serialized N network round-trips per refresh
+            await asyncio.gather(
+                *(client.stop() for client in self._ws_clients),
+                return_exceptions=True,
+            )
             self._ws_clients.clear()
-            
-            # Create new clients
-            for i in range(num_connections_needed):
-                start_idx = i * MAX_TOKENS_PER_CONNECTION
-                end_idx = min((i + 1) * MAX_TOKENS_PER_CONNECTION, num_tokens)
-                batch = token_ids[start_idx:end_idx]
-                
-                client = ClobWebSocketClient(self._price_queue)
-                await client.start(batch)
-                self._ws_clients.append(client)
-                
-                logger.info(
-                    f"Started WebSocket connection {i+1}/{num_connections_needed} "
-                    f"with {len(batch)} tokens"
-                )
-        
+
+            # Create new clients and start them concurrently
+            clients = [ClobWebSocketClient(self._price_queue) for _ in batches]
+            await asyncio.gather(
+                *(client.start(batch) for client, batch in zip(clients, batches))
+            )
+            self._ws_clients.extend(clients)
+
+            logger.info(
+                f"Started {len(clients)} WebSocket connection(s) "
+                f"covering {num_tokens} tokens"
+            )
+
         else:
-            # Same number of connections, just resubscribe
-            for i, client in enumerate(self._ws_clients):
-                start_idx = i * MAX_TOKENS_PER_CONNECTION
-                end_idx = min((i + 1) * MAX_TOKENS_PER_CONNECTION, num_tokens)
-                batch = token_ids[start_idx:end_idx]
-                
-                await client.resubscribe(batch)
+            # Same number of connections, just resubscribe (concurrently)
+            results = await asyncio.gather(
+                *(
+                    client.resubscribe(batch)
+                    for client, batch in zip(self._ws_clients, batches)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error resubscribing WebSocket client: {result}")
 
 
 # =============================================================================
@@ -175,6 +223,14 @@ multi_ws_price_aggregation = MultiConnectionPriceAggregation()
 # =============================================================================
 
 if __name__ == "__main__":
+    # Under uvicorn the loop comes from loop=auto (uvloop when
+    # installed); match that here for the standalone runner
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     async def main():
         # Start service
         await multi_ws_price_aggregation.start()
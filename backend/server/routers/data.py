@@ -1,22 +1,44 @@
 """Data endpoints for serving pipeline outputs."""
 
-import json
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from core.paths import LIVE_DIR, MIN_COVERAGE, TIER_THRESHOLDS
 from server.price_aggregation import PriceData, price_aggregation
 
 router = APIRouter()
 
+# Ascending view of TIER_THRESHOLDS for bisect-based classification
+_TIERS_ASC = sorted(TIER_THRESHOLDS)
+_TIER_KEYS = [t[0] for t in _TIERS_ASC]
+
+
+# Parsed-file cache keyed by (mtime_ns, size): repeat requests between
+# pipeline writes serve from memory instead of re-reading and
+# re-parsing the file. Callers must treat the result as read-only —
+# the portfolio recalculation copies rows before mutating them.
+_json_cache: dict[Path, tuple[int, int, Any]] = {}
+
 
 def load_json_file(path: Path) -> Any:
-    """Load JSON file, raise 404 if not found."""
-    if not path.exists():
+    """Load JSON file (cached until it changes), raise 404 if not found."""
+    try:
+        stat = path.stat()
+    except OSError:
         raise HTTPException(status_code=404, detail=f"File not found: {path.name}")
-    return json.loads(path.read_text())
+
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    data = orjson.loads(path.read_bytes())
+    _json_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
 
 
 # =============================================================================
@@ -42,41 +64,49 @@ def recalculate_portfolios_with_live_prices(
         Recalculated portfolios sorted by tier then coverage
     """
 
+    # One float per market up front: inside the loop each leg is then
+    # a single dict.get instead of a lookup, None-check, and attribute
+    # load on a PriceData object
+    price_by_market = {
+        market_id: data.price
+        for market_id, data in live_prices.items()
+        if data.price is not None
+    }
+
     recalculated = []
 
     for portfolio in portfolios:
-        # Make a copy
-        updated = json.loads(json.dumps(portfolio))
-
-        target_id = updated.get("target_market_id")
-        cover_id = updated.get("cover_market_id")
-        target_position = updated.get("target_position", "YES")
-        cover_position = updated.get("cover_position", "YES")
+        # Compute from the source dict first; rows that fall below the
+        # coverage floor are dropped before any copy is made
+        target_id = portfolio.get("target_market_id")
+        cover_id = portfolio.get("cover_market_id")
+        target_position = portfolio.get("target_position", "YES")
+        cover_position = portfolio.get("cover_position", "YES")
 
         # Get original prices
-        original_target_price = updated.get("target_price", 0.5)
-        original_cover_price = updated.get("cover_price", 0.5)
-        cover_probability = updated.get("cover_probability", 0.9)
+        original_target_price = portfolio.get("target_price", 0.5)
+        original_cover_price = portfolio.get("cover_price", 0.5)
+        cover_probability = portfolio.get("cover_probability", 0.9)
 
         # Get live prices
-        target_price_data = live_prices.get(target_id)
-        cover_price_data = live_prices.get(cover_id)
+        live_target_price = price_by_market.get(target_id)
+        live_cover_price = price_by_market.get(cover_id)
 
         # Update target price based on position
-        if target_price_data and target_price_data.price is not None:
+        if live_target_price is not None:
             if target_position == "YES":
-                new_target_price = target_price_data.price
+                new_target_price = live_target_price
             else:
-                new_target_price = 1 - target_price_data.price
+                new_target_price = 1 - live_target_price
         else:
             new_target_price = original_target_price
 
         # Update cover price based on position
-        if cover_price_data and cover_price_data.price is not None:
+        if live_cover_price is not None:
             if cover_position == "YES":
-                new_cover_price = cover_price_data.price
+                new_cover_price = live_cover_price
             else:
-                new_cover_price = 1 - cover_price_data.price
+                new_cover_price = 1 - live_cover_price
         else:
             new_cover_price = original_cover_price
 
@@ -91,16 +121,17 @@ def recalculate_portfolios_with_live_prices(
         if coverage < MIN_COVERAGE:
             continue
 
-        # Reclassify tier
-        tier = 3
-        tier_label = "MODERATE_COVERAGE"
-        for threshold, t, label in TIER_THRESHOLDS:
-            if coverage >= threshold:
-                tier = t
-                tier_label = label
-                break
+        # Reclassify tier: highest threshold <= coverage via bisect
+        # instead of a per-row linear scan
+        i = bisect_right(_TIER_KEYS, coverage) - 1
+        if i >= 0:
+            _, tier, tier_label = _TIERS_ASC[i]
+        else:
+            tier, tier_label = 3, "MODERATE_COVERAGE"
 
-        # Update portfolio
+        # Shallow copy is enough: every field assigned below is a
+        # top-level scalar, nested structures are never written
+        updated = portfolio.copy()
         updated["target_price"] = round(new_target_price, 4)
         updated["cover_price"] = round(new_cover_price, 4)
         updated["total_cost"] = round(total_cost, 4)
@@ -122,7 +153,7 @@ def recalculate_portfolios_with_live_prices(
     return recalculated
 
 
-@router.get("/portfolios")
+@router.get("/portfolios", response_class=ORJSONResponse)
 async def get_portfolios(
     limit: int | None = Query(
         None, description="Max number of portfolios to return (default: no limit)"
@@ -7,13 +7,15 @@ Endpoints:
 """
 
 import asyncio
-import json
+import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, List, Optional
 
 import httpx
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from core.paths import GAMMA_API_BASE_URL, LIVE_DIR
@@ -37,6 +39,11 @@ FINANCE_KEYWORDS = [
     "unemployment", "recession", "bull market", "bear market", "earnings"
 ]
 
+# Compiled alternations: one scan over the title instead of a Python-level
+# substring search per keyword
+_CRYPTO_RE = re.compile("|".join(map(re.escape, CRYPTO_KEYWORDS)))
+_FINANCE_RE = re.compile("|".join(map(re.escape, FINANCE_KEYWORDS)))
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -58,14 +65,11 @@ def categorize_market(title: str, tags: List[str]) -> str:
         return "finance"
     
     # Check title keywords
-    for keyword in CRYPTO_KEYWORDS:
-        if keyword in title_lower:
-            return "crypto"
-    
-    for keyword in FINANCE_KEYWORDS:
-        if keyword in title_lower:
-            return "finance"
-    
+    if _CRYPTO_RE.search(title_lower):
+        return "crypto"
+    if _FINANCE_RE.search(title_lower):
+        return "finance"
+
     return "other"
 
 
@@ -131,7 +135,7 @@ async def fetch_market_from_gamma(market_id: str) -> Optional[dict]:
 # =============================================================================
 
 
-@router.get("/")
+@router.get("/", response_class=ORJSONResponse)
 async def list_markets(
     category: str = Query("all", regex="^(crypto|finance|all)$"),
     limit: int = Query(50, ge=1, le=200),
@@ -147,7 +151,7 @@ async def list_markets(
         # 1. Try to load from local groups.json
         groups_file = LIVE_DIR / "groups.json"
         if groups_file.exists():
-            groups_data = json.loads(groups_file.read_text())
+            groups_data = orjson.loads(groups_file.read_bytes())
             groups = groups_data.get("groups", [])
             live_prices = price_aggregation.get_prices()
             
@@ -219,7 +223,7 @@ async def list_markets(
         }
 
 
-@router.get("/{market_id}/stats")
+@router.get("/{market_id}/stats", response_class=ORJSONResponse)
 async def get_market_stats(market_id: str):
     """Get detailed statistics for a specific market."""
     try:
@@ -246,7 +250,7 @@ async def get_market_stats(market_id: str):
             "created_at": market_data.get("createdAt"),
             "closed": market_data.get("closed", False),
             "active": market_data.get("active", True),
-            "clob_token_ids": json.loads(market_data.get("clobTokenIds", "[]")),
+            "clob_token_ids": orjson.loads(market_data.get("clobTokenIds", "[]")),
             "recent_trades": [],
             "price_history": []
         }